@@ -353,11 +353,11 @@ class AnalyticsDashboard:
                 return
             
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"analytics_data_{timestamp}.json"
+            filename = f"analytics_data_{timestamp}.jsonl"
             
             filepath = filedialog.asksaveasfilename(
-                defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                defaultextension=".jsonl",
+                filetypes=[("JSON Lines files", "*.jsonl"), ("All files", "*.*")],
                 initialname=filename
             )
             
@@ -9,8 +9,8 @@ from failures without requiring a restart.
 import threading
 import time
 import logging
-import traceback
-from typing import Optional, Callable, Dict, Any, List, Type
+import re
+from typing import Optional, Callable, Dict, Any, List, Tuple, Type
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
@@ -41,10 +41,27 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
+# Keyword classification of lower-cased error messages, in category priority
+# order: the first category with a keyword anywhere in the message wins
+_MESSAGE_CATEGORY_KEYWORDS = (
+    (ErrorCategory.AUDIO, ('audio', 'microphone', 'pyaudio', 'device', 'sound', 'recording')),
+    (ErrorCategory.TRANSCRIPTION, ('transcription', 'speech', 'assemblyai', 'whisper', 'recognize')),
+    (ErrorCategory.AI_ENHANCEMENT, ('openai', 'gpt', 'enhancement', 'ai', 'completion', 'model')),
+    (ErrorCategory.TEXT_INSERTION, ('insertion', 'text', 'cursor', 'clipboard', 'typing', 'input')),
+    (ErrorCategory.CONFIGURATION, ('config', 'api_key', 'settings', 'configuration', 'setup')),
+    (ErrorCategory.RESOURCE, ('memory', 'resource', 'disk', 'space', 'quota', 'allocation')),
+    (ErrorCategory.NETWORK, ('network', 'connection', 'timeout', 'http', 'ssl', 'dns')),
+    (ErrorCategory.PERMISSION, ('permission', 'access', 'denied', 'unauthorized', 'forbidden')),
+    (ErrorCategory.HOTKEY, ('hotkey', 'keyboard', 'shortcut', 'binding')),
+)
+
+_CRITICAL_PATTERN = re.compile("fatal|critical|unrecoverable")
+
+
 @dataclass
 class ErrorInfo:
     """Error information structure."""
-    timestamp: datetime
+    timestamp: int  # Nanoseconds since the epoch (time.time_ns())
     error_type: Type[Exception]
     error_message: str
     severity: ErrorSeverity
@@ -55,6 +72,11 @@ class ErrorInfo:
     max_retries: int = 3
     recovery_strategy: Optional[str] = None
     stack_trace: Optional[str] = None
+    
+    @property
+    def datetime(self) -> datetime:
+        """Timestamp as a local datetime, for display."""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
 
 
 class RecoveryStrategy:
@@ -203,9 +225,9 @@ class ErrorHandler:
             ConfigurationRecoveryStrategy(),
         ]
         
-        # Callbacks
-        self.error_callbacks: List[Callable[[ErrorInfo], None]] = []
-        self.recovery_callbacks: List[Callable[[ErrorInfo, bool], None]] = []
+        # Callbacks (copy-on-write tuples, safe to iterate without a lock)
+        self.error_callbacks: Tuple[Callable[[ErrorInfo], None], ...] = ()
+        self.recovery_callbacks: Tuple[Callable[[ErrorInfo, bool], None], ...] = ()
         
         # Statistics
         self.error_count = 0
@@ -251,12 +273,13 @@ class ErrorHandler:
                 self.recovery_success_count += 1
             else:
                 self.recovery_failure_count += 1
-            
-            # Notify callbacks
-            self._notify_error_callbacks(error_info)
-            self._notify_recovery_callbacks(error_info, recovery_success)
-            
-            return error_info
+        
+        # Notify callbacks outside the lock so slow callbacks don't block
+        # other threads reporting errors
+        self._notify_error_callbacks(error_info)
+        self._notify_recovery_callbacks(error_info, recovery_success)
+        
+        return error_info
     
     def _create_error_info(self, 
                           exception: Exception, 
@@ -267,16 +290,23 @@ class ErrorHandler:
         category = self._classify_error(exception)
         severity = self._determine_severity(exception, category)
         
+        # The stack trace is only ever emitted at debug level, so skip
+        # formatting it (and importing traceback) unless it will be logged
+        stack_trace = None
+        if self.logger.isEnabledFor(logging.DEBUG):
+            import traceback
+            stack_trace = traceback.format_exc()
+        
         # Create error info
         error_info = ErrorInfo(
-            timestamp=datetime.now(),
+            timestamp=time.time_ns(),
             error_type=type(exception),
             error_message=str(exception),
             severity=severity,
             category=category,
             workflow_step=workflow_step,
             application_state=application_state,
-            stack_trace=traceback.format_exc()
+            stack_trace=stack_trace
         )
         
         return error_info
@@ -323,40 +353,18 @@ class ErrorHandler:
         if 'memory' in exception_type or 'resource' in exception_type:
             return ErrorCategory.RESOURCE
         
-        # Audio errors
-        if any(keyword in error_message for keyword in ['audio', 'microphone', 'pyaudio', 'device', 'sound', 'recording']):
-            return ErrorCategory.AUDIO
-        
-        # Transcription errors
-        if any(keyword in error_message for keyword in ['transcription', 'speech', 'assemblyai', 'whisper', 'recognize']):
-            return ErrorCategory.TRANSCRIPTION
-        
-        # AI enhancement errors
-        if any(keyword in error_message for keyword in ['openai', 'gpt', 'enhancement', 'ai', 'completion', 'model']) and 'api key' not in error_message and 'allocation' not in error_message:
-            return ErrorCategory.AI_ENHANCEMENT
-        
-        # Text insertion errors
-        if any(keyword in error_message for keyword in ['insertion', 'text', 'cursor', 'clipboard', 'typing', 'input']):
-            return ErrorCategory.TEXT_INSERTION
-        
-        # Configuration errors (check first to avoid conflicts)
-        if any(keyword in error_message for keyword in ['config', 'api_key', 'settings', 'configuration', 'setup']):
-            return ErrorCategory.CONFIGURATION
-        
-        # Resource errors (check before AI enhancement to avoid conflicts)
-        if any(keyword in error_message for keyword in ['memory', 'resource', 'disk', 'space', 'quota', 'allocation']):
-            return ErrorCategory.RESOURCE
-        
-        # Network errors
-        if any(keyword in error_message for keyword in ['network', 'connection', 'timeout', 'http', 'ssl', 'dns']):
-            return ErrorCategory.NETWORK
-        
-        # Permission errors
-        if any(keyword in error_message for keyword in ['permission', 'access', 'denied', 'unauthorized', 'forbidden']):
-            return ErrorCategory.PERMISSION
-        
-        # Hotkey errors (check after configuration to avoid conflicts)
-        if any(keyword in error_message for keyword in ['hotkey', 'keyboard', 'shortcut', 'binding']) or ('key' in error_message and 'api_key' not in error_message and 'authentication' not in error_message):
+        # Message keywords, checked in category priority order
+        contains = error_message.__contains__
+        for category, keywords in _MESSAGE_CATEGORY_KEYWORDS:
+            if not any(map(contains, keywords)):
+                continue
+            # AI enhancement, unless it is really an API key or allocation problem
+            if category is ErrorCategory.AI_ENHANCEMENT and (contains('api key') or contains('allocation')):
+                continue
+            return category
+        
+        # A bare "key" that isn't about API authentication is a hotkey problem
+        if contains('key') and not contains('api_key') and not contains('authentication'):
             return ErrorCategory.HOTKEY
         
         return ErrorCategory.UNKNOWN
@@ -366,7 +374,7 @@ class ErrorHandler:
         error_message = str(exception).lower()
         
         # Critical errors
-        if any(keyword in error_message for keyword in ['fatal', 'critical', 'unrecoverable']):
+        if _CRITICAL_PATTERN.search(error_message):
             return ErrorSeverity.CRITICAL
         
         # High severity errors
@@ -427,7 +435,8 @@ class ErrorHandler:
     
     def _notify_error_callbacks(self, error_info: ErrorInfo):
         """Notify error callbacks."""
-        for callback in self.error_callbacks:
+        callbacks = self.error_callbacks
+        for callback in callbacks:
             try:
                 callback(error_info)
             except Exception as e:
@@ -435,7 +444,8 @@ class ErrorHandler:
     
     def _notify_recovery_callbacks(self, error_info: ErrorInfo, recovery_success: bool):
         """Notify recovery callbacks."""
-        for callback in self.recovery_callbacks:
+        callbacks = self.recovery_callbacks
+        for callback in callbacks:
             try:
                 callback(error_info, recovery_success)
             except Exception as e:
@@ -443,27 +453,28 @@ class ErrorHandler:
     
     def add_error_callback(self, callback: Callable[[ErrorInfo], None]):
         """Add callback for error notifications."""
-        self.error_callbacks.append(callback)
+        self.error_callbacks = self.error_callbacks + (callback,)
     
     def add_recovery_callback(self, callback: Callable[[ErrorInfo, bool], None]):
         """Add callback for recovery notifications."""
-        self.recovery_callbacks.append(callback)
+        self.recovery_callbacks = self.recovery_callbacks + (callback,)
     
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get error handling statistics."""
+        recent_cutoff = time.time_ns() - 3600 * 1_000_000_000
+        
         with self.error_lock:
             return {
                 'total_errors': self.error_count,
                 'recovery_successes': self.recovery_success_count,
                 'recovery_failures': self.recovery_failure_count,
                 'recovery_rate': (self.recovery_success_count / max(self.error_count, 1)) * 100,
-                'recent_errors': len([e for e in self.error_history if 
-                                    (datetime.now() - e.timestamp).seconds < 3600])
+                'recent_errors': sum(1 for e in self.error_history if e.timestamp >= recent_cutoff)
             }
     
     def get_error_history(self, hours: int = 24) -> List[ErrorInfo]:
         """Get error history for the specified time period."""
-        cutoff_time = datetime.now().replace(hour=datetime.now().hour - hours)
+        cutoff_time = time.time_ns() - hours * 3600 * 1_000_000_000
         
         with self.error_lock:
             return [error for error in self.error_history if error.timestamp > cutoff_time]
@@ -482,8 +493,8 @@ class ErrorHandler:
         
         try:
             # Clear callbacks
-            self.error_callbacks.clear()
-            self.recovery_callbacks.clear()
+            self.error_callbacks = ()
+            self.recovery_callbacks = ()
             
             # Clear error history
             self.clear_error_history()
@@ -504,14 +515,16 @@ class ErrorHandler:
                 sys.__excepthook__(exc_type, exc_value, exc_traceback)
                 return
             
+            import traceback
+            
             # Create error info for uncaught exception
             error_info = ErrorInfo(
-                timestamp=datetime.now(),
+                timestamp=time.time_ns(),
                 error_type=exc_type,
                 error_message=str(exc_value),
                 severity=ErrorSeverity.HIGH,
                 category=ErrorCategory.UNKNOWN,
-                stack_trace=traceback.format_exception(exc_type, exc_value, exc_traceback)
+                stack_trace=''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
             )
             
             # Log the uncaught exception
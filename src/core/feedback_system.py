@@ -6,9 +6,12 @@ audio cues, and system tray notifications for all application states.
 """
 
 import threading
-import time
 import logging
-from typing import Optional, Callable, Dict, Any, List
+from collections import deque
+import heapq
+import itertools
+import time
+from typing import Optional, Callable, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import winsound
@@ -17,6 +20,11 @@ from ctypes import wintypes
 
 from .application_controller import ApplicationState
 from .workflow_manager import WorkflowStep
+from utils.audio_tones import AUDIO_QUEUE_SIZE, synthesize_tone
+
+
+# Tray icon changes within this window are coalesced into one update
+TRAY_UPDATE_DELAY_SECONDS = 0.05
 
 
 class FeedbackType(Enum):
@@ -34,7 +42,7 @@ class FeedbackLevel(Enum):
     HIGH = "high"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioFeedback:
     """Audio feedback configuration."""
     frequency: int
@@ -42,93 +50,56 @@ class AudioFeedback:
     volume: int = 50
 
 
+def _synthesize_tone(feedback: AudioFeedback) -> bytes:
+    """Render a feedback tone as an in-memory WAV file."""
+    return synthesize_tone(feedback.frequency, feedback.duration, feedback.volume / 100)
+
+
 class VisualFeedback:
     """Visual feedback indicators."""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.is_active = False
-        self.flash_thread = None
-        self.stop_flash = threading.Event()
+        # Effect currently shown ("recording", "processing", "error", "success")
+        self.current_effect: Optional[str] = None
     
     def show_recording_indicator(self):
         """Show recording indicator (e.g., flashing red)."""
-        self.logger.info("Showing recording indicator")
+        self.logger.debug("Showing recording indicator")
         self._start_flash_effect("recording")
     
     def show_processing_indicator(self):
         """Show processing indicator (e.g., spinning or pulsing)."""
-        self.logger.info("Showing processing indicator")
+        self.logger.debug("Showing processing indicator")
         self._start_flash_effect("processing")
     
     def show_error_indicator(self):
         """Show error indicator (e.g., solid red)."""
-        self.logger.info("Showing error indicator")
+        self.logger.debug("Showing error indicator")
         self._start_flash_effect("error")
     
     def show_success_indicator(self):
         """Show success indicator (e.g., green flash)."""
-        self.logger.info("Showing success indicator")
+        self.logger.debug("Showing success indicator")
         self._start_flash_effect("success")
     
     def hide_all_indicators(self):
         """Hide all visual indicators."""
-        self.logger.info("Hiding all indicators")
+        self.logger.debug("Hiding all indicators")
         self._stop_flash_effect()
     
     def _start_flash_effect(self, effect_type: str):
         """Start a flashing effect for visual feedback."""
-        self._stop_flash_effect()
-        
+        # Animation belongs to the tray/UI layer, which can read current_effect
+        # from its own message-loop timer; nothing here needs a thread
+        self.current_effect = effect_type
         self.is_active = True
-        self.stop_flash.clear()
-        
-        if effect_type == "recording":
-            self.flash_thread = threading.Thread(target=self._flash_red, daemon=True)
-        elif effect_type == "processing":
-            self.flash_thread = threading.Thread(target=self._flash_yellow, daemon=True)
-        elif effect_type == "error":
-            self.flash_thread = threading.Thread(target=self._flash_error, daemon=True)
-        elif effect_type == "success":
-            self.flash_thread = threading.Thread(target=self._flash_success, daemon=True)
-        
-        self.flash_thread.start()
     
     def _stop_flash_effect(self):
         """Stop the current flashing effect."""
-        if self.flash_thread and self.flash_thread.is_alive():
-            self.stop_flash.set()
-            self.flash_thread.join(timeout=1.0)
-        
+        self.current_effect = None
         self.is_active = False
-    
-    def _flash_red(self):
-        """Flash red for recording state."""
-        while not self.stop_flash.is_set():
-            # Flash red (this would integrate with system tray or UI)
-            time.sleep(0.5)
-    
-    def _flash_yellow(self):
-        """Flash yellow for processing state."""
-        while not self.stop_flash.is_set():
-            # Flash yellow (this would integrate with system tray or UI)
-            time.sleep(0.3)
-    
-    def _flash_error(self):
-        """Flash error indicator."""
-        for _ in range(3):  # Flash 3 times
-            if self.stop_flash.is_set():
-                break
-            # Flash error color
-            time.sleep(0.2)
-    
-    def _flash_success(self):
-        """Flash success indicator."""
-        for _ in range(2):  # Flash 2 times
-            if self.stop_flash.is_set():
-                break
-            # Flash success color
-            time.sleep(0.1)
 
 
 class AudioFeedbackSystem:
@@ -147,6 +118,23 @@ class AudioFeedbackSystem:
             'error': AudioFeedback(400, 300),             # Low error tone
             'warning': AudioFeedback(600, 150),           # Warning tone
         }
+        
+        # Tones are rendered once so playback is a PlaySound from memory
+        # rather than a Beep synthesized per call
+        self._wav_bytes = {
+            name: _synthesize_tone(feedback) for name, feedback in self.audio_feedback.items()
+        }
+        
+        # Playing from memory cannot be asynchronous, so tones are played by a
+        # single worker. Producers only append to a bounded deque and set an
+        # event, so the hook threads reporting state changes never take a lock.
+        self._audio_tones: deque = deque(maxlen=AUDIO_QUEUE_SIZE)
+        self._audio_pending = threading.Event()
+        self._audio_running = True
+        self._audio_thread = threading.Thread(
+            target=self._audio_worker, name="AudioFeedback", daemon=True
+        )
+        self._audio_thread.start()
     
     def play_recording_start(self):
         """Play audio for recording start."""
@@ -173,28 +161,115 @@ class AudioFeedbackSystem:
         self._play_audio('warning')
     
     def _play_audio(self, feedback_type: str):
-        """Play audio feedback using Windows API."""
+        """Queue audio feedback for the audio worker."""
         if not self.audio_enabled:
             return
         
-        try:
-            feedback = self.audio_feedback.get(feedback_type)
-            if feedback:
-                winsound.Beep(feedback.frequency, feedback.duration)
-                self.logger.debug(f"Played audio feedback: {feedback_type}")
-        except Exception as e:
-            self.logger.error(f"Failed to play audio feedback: {e}")
+        if feedback_type in self._wav_bytes:
+            self._audio_tones.append(feedback_type)
+            self._audio_pending.set()
+    
+    def _audio_worker(self):
+        """Play queued tones using Windows API until stopped."""
+        log = self.logger
+        tones = self._audio_tones
+        wav_bytes = self._wav_bytes
+        flags = winsound.SND_MEMORY | winsound.SND_NODEFAULT
+        
+        while self._audio_running:
+            self._audio_pending.wait()
+            # Clear before draining so a tone appended meanwhile re-arms it
+            self._audio_pending.clear()
+            
+            while self._audio_running:
+                try:
+                    feedback_type = tones.popleft()
+                except IndexError:
+                    break
+                if not self.audio_enabled:
+                    continue
+                
+                try:
+                    winsound.PlaySound(wav_bytes[feedback_type], flags)
+                    log.debug("Played audio feedback: %s", feedback_type)
+                except Exception as e:
+                    log.error("Failed to play audio feedback: %s", e)
     
     def set_audio_enabled(self, enabled: bool):
         """Enable or disable audio feedback."""
         self.audio_enabled = enabled
-        self.logger.info(f"Audio feedback {'enabled' if enabled else 'disabled'}")
+        self.logger.info("Audio feedback %s", "enabled" if enabled else "disabled")
+    
+    def shutdown(self):
+        """Stop the audio worker, discarding any queued tones."""
+        self.audio_enabled = False
+        self._audio_running = False
+        self._audio_tones.clear()
+        self._audio_pending.set()
+        self._audio_thread.join(timeout=1.0)
+
+
+class _DelayScheduler:
+    """Runs callables after a delay on a single long-lived worker thread."""
+    
+    def __init__(self, name: str):
+        self.logger = logging.getLogger(__name__)
+        self._entries: list = []  # heap of (deadline, sequence, callable)
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+    
+    def schedule(self, delay: float, func: Callable[[], None]):
+        """Run func on the worker thread once delay seconds have passed."""
+        deadline = time.monotonic() + delay
+        with self._condition:
+            if not self._running:
+                return
+            heapq.heappush(self._entries, (deadline, next(self._sequence), func))
+            self._condition.notify()
+    
+    def _run(self):
+        """Sleep until the earliest deadline and fire whatever is due."""
+        while True:
+            with self._condition:
+                while self._running:
+                    if not self._entries:
+                        self._condition.wait()
+                        continue
+                    timeout = self._entries[0][0] - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                if not self._running:
+                    return
+                
+                due = []
+                now = time.monotonic()
+                while self._entries and self._entries[0][0] <= now:
+                    due.append(heapq.heappop(self._entries)[2])
+            
+            # Run outside the lock so callbacks may schedule more work
+            for func in due:
+                try:
+                    func()
+                except Exception as e:
+                    self.logger.error("Scheduled feedback callback error: %s", e)
+    
+    def shutdown(self):
+        """Drop pending callables and stop the worker."""
+        with self._condition:
+            self._running = False
+            self._entries.clear()
+            self._condition.notify()
+        self._thread.join(timeout=1.0)
 
 
 class SystemTrayFeedback:
     """System tray feedback integration."""
     
-    def __init__(self):
+    def __init__(self, scheduler: Optional[_DelayScheduler] = None):
         self.logger = logging.getLogger(__name__)
         self.tray_icon = None
         self.icon_states = {
@@ -203,16 +278,42 @@ class SystemTrayFeedback:
             'processing': 'icon_processing.ico',
             'error': 'icon_error.ico'
         }
+        
+        # Latest requested icon state, applied by a flush on the scheduler.
+        # Without a scheduler every update is applied immediately.
+        self._scheduler = scheduler
+        self._pending_state: Optional[str] = None
+        self._flush_scheduled = False
+        self._update_lock = threading.Lock()
     
     def update_tray_icon(self, state: str):
         """Update system tray icon based on application state."""
-        self.logger.info(f"Updating tray icon to: {state}")
-        # This would integrate with pystray or similar library
-        # For now, we'll just log the state change
+        with self._update_lock:
+            self._pending_state = state
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        
+        if self._scheduler is None:
+            self._flush_tray_icon()
+        else:
+            self._scheduler.schedule(TRAY_UPDATE_DELAY_SECONDS, self._flush_tray_icon)
+    
+    def _flush_tray_icon(self):
+        """Apply the most recent pending icon state."""
+        with self._update_lock:
+            state = self._pending_state
+            self._pending_state = None
+            self._flush_scheduled = False
+        
+        if state is not None:
+            self.logger.debug("Updating tray icon to: %s", state)
+            # This would integrate with pystray or similar library
+            # For now, we'll just log the state change
     
     def show_notification(self, title: str, message: str, duration: int = 3000):
         """Show a system tray notification."""
-        self.logger.info(f"Tray notification: {title} - {message}")
+        self.logger.info("Tray notification: %s - %s", title, message)
         # This would integrate with system tray notification API
         # For now, we'll just log the notification
 
@@ -234,22 +335,45 @@ class UserFeedbackSystem:
         """
         self.logger = logging.getLogger(__name__)
         
+        # Delayed feedback (e.g. hiding indicators, debounced tray updates)
+        # runs on one shared thread
+        self._scheduler = _DelayScheduler("FeedbackScheduler")
+        
         # Feedback components
         self.visual_feedback = VisualFeedback()
         self.audio_feedback = AudioFeedbackSystem()
-        self.tray_feedback = SystemTrayFeedback()
+        self.tray_feedback = SystemTrayFeedback(self._scheduler)
         
         # Configuration
         self.feedback_type = feedback_type
         self.feedback_level = FeedbackLevel.MEDIUM
+        self._audio_on = False
+        self._visual_on = False
+        self._update_feedback_gates()
         
         # State tracking
         self.current_state = None
         self.current_workflow_step = None
         
-        # Callbacks
-        self.state_callbacks: List[Callable[[str], None]] = []
-        self.workflow_callbacks: List[Callable[[str], None]] = []
+        # Feedback handler for each application state and workflow step
+        self._state_feedback: Dict[ApplicationState, Callable[[], None]] = {
+            ApplicationState.RECORDING: self._feedback_recording_start,
+            ApplicationState.PROCESSING: self._feedback_processing_start,
+            ApplicationState.IDLE: self._feedback_idle,
+            ApplicationState.ERROR: self._feedback_error,
+        }
+        self._step_feedback: Dict[WorkflowStep, Callable[[], None]] = {
+            WorkflowStep.RECORDING: self._feedback_recording_start,
+            WorkflowStep.TRANSCRIBING: self._feedback_transcribing_start,
+            WorkflowStep.ENHANCING: self._feedback_enhancing_start,
+            WorkflowStep.INSERTING: self._feedback_inserting_start,
+            WorkflowStep.COMPLETED: self._feedback_workflow_completed,
+            WorkflowStep.ERROR: self._feedback_workflow_error,
+        }
+        
+        # Callbacks (copy-on-write tuples, safe to iterate without a lock)
+        self.state_callbacks: Tuple[Callable[[str], None], ...] = ()
+        self.workflow_callbacks: Tuple[Callable[[str], None], ...] = ()
         
         self.logger.info("UserFeedbackSystem initialized")
     
@@ -259,27 +383,28 @@ class UserFeedbackSystem:
             old_state = self.current_state
             self.current_state = new_state
             
-            self.logger.info(f"Application state changed: {old_state} -> {new_state}")
+            # Nothing to signal and nobody listening
+            if self.feedback_level == FeedbackLevel.NONE and not self.state_callbacks:
+                return
+            
+            log = self.logger
+            log.info("Application state changed: %s -> %s", old_state, new_state)
             
             # Provide appropriate feedback
-            if new_state == ApplicationState.RECORDING:
-                self._feedback_recording_start()
-            elif new_state == ApplicationState.PROCESSING:
-                self._feedback_processing_start()
-            elif new_state == ApplicationState.IDLE:
-                self._feedback_idle()
-            elif new_state == ApplicationState.ERROR:
-                self._feedback_error()
+            handler = self._state_feedback.get(new_state)
+            if handler is not None:
+                handler()
             
             # Update system tray
             self.tray_feedback.update_tray_icon(new_state.value)
             
             # Notify callbacks
-            for callback in self.state_callbacks:
+            callbacks = self.state_callbacks
+            for callback in callbacks:
                 try:
                     callback(new_state.value)
                 except Exception as e:
-                    self.logger.error(f"State callback error: {e}")
+                    log.error("State callback error: %s", e)
     
     def on_workflow_step_change(self, new_step: WorkflowStep):
         """Handle workflow step changes."""
@@ -287,39 +412,35 @@ class UserFeedbackSystem:
             old_step = self.current_workflow_step
             self.current_workflow_step = new_step
             
-            self.logger.info(f"Workflow step changed: {old_step} -> {new_step}")
+            if self.feedback_level == FeedbackLevel.NONE and not self.workflow_callbacks:
+                return
+            
+            log = self.logger
+            log.info("Workflow step changed: %s -> %s", old_step, new_step)
             
             # Provide step-specific feedback
-            if new_step == WorkflowStep.RECORDING:
-                self._feedback_recording_start()
-            elif new_step == WorkflowStep.TRANSCRIBING:
-                self._feedback_transcribing_start()
-            elif new_step == WorkflowStep.ENHANCING:
-                self._feedback_enhancing_start()
-            elif new_step == WorkflowStep.INSERTING:
-                self._feedback_inserting_start()
-            elif new_step == WorkflowStep.COMPLETED:
-                self._feedback_workflow_completed()
-            elif new_step == WorkflowStep.ERROR:
-                self._feedback_workflow_error()
+            handler = self._step_feedback.get(new_step)
+            if handler is not None:
+                handler()
             
             # Notify callbacks
-            for callback in self.workflow_callbacks:
+            callbacks = self.workflow_callbacks
+            for callback in callbacks:
                 try:
                     callback(new_step.value)
                 except Exception as e:
-                    self.logger.error(f"Workflow callback error: {e}")
+                    log.error("Workflow callback error: %s", e)
     
     def on_error(self, error_message: str):
         """Handle error notifications."""
-        self.logger.error(f"Error feedback: {error_message}")
+        self.logger.error("Error feedback: %s", error_message)
         
         # Audio feedback
-        if self.feedback_type in [FeedbackType.AUDIO, FeedbackType.BOTH]:
+        if self._audio_on:
             self.audio_feedback.play_error()
         
         # Visual feedback
-        if self.feedback_type in [FeedbackType.VISUAL, FeedbackType.BOTH]:
+        if self._visual_on:
             self.visual_feedback.show_error_indicator()
         
         # System tray notification
@@ -331,112 +452,121 @@ class UserFeedbackSystem:
     
     def _feedback_recording_start(self):
         """Provide feedback for recording start."""
-        self.logger.info("Providing recording start feedback")
+        self.logger.debug("Providing recording start feedback")
         
-        if self.feedback_type in [FeedbackType.AUDIO, FeedbackType.BOTH]:
+        if self._audio_on:
             self.audio_feedback.play_recording_start()
         
-        if self.feedback_type in [FeedbackType.VISUAL, FeedbackType.BOTH]:
+        if self._visual_on:
             self.visual_feedback.show_recording_indicator()
     
     def _feedback_processing_start(self):
         """Provide feedback for processing start."""
-        self.logger.info("Providing processing start feedback")
+        self.logger.debug("Providing processing start feedback")
         
-        if self.feedback_type in [FeedbackType.AUDIO, FeedbackType.BOTH]:
+        if self._audio_on:
             self.audio_feedback.play_processing()
         
-        if self.feedback_type in [FeedbackType.VISUAL, FeedbackType.BOTH]:
+        if self._visual_on:
             self.visual_feedback.show_processing_indicator()
     
     def _feedback_transcribing_start(self):
         """Provide feedback for transcription start."""
-        self.logger.info("Providing transcription start feedback")
+        self.logger.debug("Providing transcription start feedback")
         # Could add specific feedback for transcription step
     
     def _feedback_enhancing_start(self):
         """Provide feedback for text enhancement start."""
-        self.logger.info("Providing enhancement start feedback")
+        self.logger.debug("Providing enhancement start feedback")
         # Could add specific feedback for enhancement step
     
     def _feedback_inserting_start(self):
         """Provide feedback for text insertion start."""
-        self.logger.info("Providing insertion start feedback")
+        self.logger.debug("Providing insertion start feedback")
         # Could add specific feedback for insertion step
     
     def _feedback_workflow_completed(self):
         """Provide feedback for workflow completion."""
-        self.logger.info("Providing workflow completion feedback")
+        self.logger.debug("Providing workflow completion feedback")
         
-        if self.feedback_type in [FeedbackType.AUDIO, FeedbackType.BOTH]:
+        if self._audio_on:
             self.audio_feedback.play_success()
         
-        if self.feedback_type in [FeedbackType.VISUAL, FeedbackType.BOTH]:
+        if self._visual_on:
             self.visual_feedback.show_success_indicator()
         
         # Hide indicators after a short delay
-        threading.Timer(2.0, self.visual_feedback.hide_all_indicators).start()
+        self._scheduler.schedule(2.0, self.visual_feedback.hide_all_indicators)
     
     def _feedback_workflow_error(self):
         """Provide feedback for workflow error."""
-        self.logger.info("Providing workflow error feedback")
+        self.logger.debug("Providing workflow error feedback")
         
-        if self.feedback_type in [FeedbackType.AUDIO, FeedbackType.BOTH]:
+        if self._audio_on:
             self.audio_feedback.play_error()
         
-        if self.feedback_type in [FeedbackType.VISUAL, FeedbackType.BOTH]:
+        if self._visual_on:
             self.visual_feedback.show_error_indicator()
     
     def _feedback_idle(self):
         """Provide feedback for idle state."""
-        self.logger.info("Providing idle feedback")
+        self.logger.debug("Providing idle feedback")
         
-        if self.feedback_type in [FeedbackType.AUDIO, FeedbackType.BOTH]:
+        if self._audio_on:
             self.audio_feedback.play_recording_stop()
         
-        if self.feedback_type in [FeedbackType.VISUAL, FeedbackType.BOTH]:
+        if self._visual_on:
             self.visual_feedback.hide_all_indicators()
     
     def _feedback_error(self):
         """Provide feedback for error state."""
-        self.logger.info("Providing error feedback")
+        self.logger.debug("Providing error feedback")
         
-        if self.feedback_type in [FeedbackType.AUDIO, FeedbackType.BOTH]:
+        if self._audio_on:
             self.audio_feedback.play_error()
         
-        if self.feedback_type in [FeedbackType.VISUAL, FeedbackType.BOTH]:
+        if self._visual_on:
             self.visual_feedback.show_error_indicator()
     
+    def _update_feedback_gates(self):
+        """Precompute which feedback channels are active."""
+        enabled = self.feedback_level != FeedbackLevel.NONE
+        self._audio_on = enabled and self.feedback_type in (FeedbackType.AUDIO, FeedbackType.BOTH)
+        self._visual_on = enabled and self.feedback_type in (FeedbackType.VISUAL, FeedbackType.BOTH)
+    
     def set_feedback_type(self, feedback_type: FeedbackType):
         """Set the type of feedback to provide."""
         self.feedback_type = feedback_type
-        self.logger.info(f"Feedback type set to: {feedback_type}")
+        self._update_feedback_gates()
+        self.logger.info("Feedback type set to: %s", feedback_type)
     
     def set_feedback_level(self, level: FeedbackLevel):
         """Set the feedback level."""
         self.feedback_level = level
-        self.logger.info(f"Feedback level set to: {level}")
+        self._update_feedback_gates()
+        self.logger.info("Feedback level set to: %s", level)
     
     def add_state_callback(self, callback: Callable[[str], None]):
         """Add callback for state changes."""
-        self.state_callbacks.append(callback)
+        self.state_callbacks = self.state_callbacks + (callback,)
     
     def add_workflow_callback(self, callback: Callable[[str], None]):
         """Add callback for workflow step changes."""
-        self.workflow_callbacks.append(callback)
+        self.workflow_callbacks = self.workflow_callbacks + (callback,)
     
     def shutdown(self):
         """Shutdown the feedback system."""
         self.logger.info("Shutting down feedback system")
         
         try:
-            # Stop visual feedback
+            # Stop visual feedback and any pending delayed feedback
+            self._scheduler.shutdown()
             self.visual_feedback.hide_all_indicators()
             
-            # Disable audio feedback
-            self.audio_feedback.set_audio_enabled(False)
+            # Disable audio feedback and stop its worker
+            self.audio_feedback.shutdown()
             
             self.logger.info("Feedback system shutdown completed")
             
         except Exception as e:
-            self.logger.error(f"Error during feedback system shutdown: {e}") 
\ No newline at end of file
+            self.logger.error("Error during feedback system shutdown: %s", e) 
\ No newline at end of file
@@ -8,19 +8,99 @@ and anonymized usage statistics collection to support optimization and troublesh
 import threading
 import time
 import psutil
+import numpy as np
 import json
 import hashlib
 import os
-from typing import Optional, Dict, Any, List, Callable
-from dataclasses import dataclass, asdict
+import queue
+from array import array
+from bisect import bisect_right
+from collections import deque
+from itertools import chain, count, islice
+from typing import Optional, Dict, Any, List, Callable, Deque, Iterable, Iterator, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from .application_controller import ApplicationState
 from .workflow_manager import WorkflowStep
 
 
+# History limits for the in-memory ring buffers
+MAX_METRICS = 10000
+MAX_WORKFLOWS = 5000
+MAX_RESOURCE_SAMPLES = 1000
+
+# Multi-resolution resource history as (keep every Nth sample, capacity).
+# At the default 1s interval this covers ~16 minutes at full resolution,
+# just over an hour at 10s and just over a day at one-minute resolution.
+RESOURCE_TIERS = (
+    (1, MAX_RESOURCE_SAMPLES),
+    (10, 400),
+    (60, 1500),
+)
+
+# Nanoseconds per day, for retention cutoffs on time.time_ns() timestamps
+NS_PER_DAY = 86400 * 10**9
+
+# Seconds between disk usage reads in the resource monitor
+DISK_USAGE_REFRESH_SECONDS = 30.0
+
+# Compact separators for JSON written by the monitor
+JSON_SEPARATORS = (',', ':')
+
+# Seconds between background checkpoints of new analytics records
+CHECKPOINT_INTERVAL_SECONDS = 300.0
+
+# Bytes of JSON Lines buffered before each write and fsync when saving
+SAVE_BATCH_BYTES = 1024 * 1024
+
+# Workflow steps whose durations count towards total processing time
+PROCESSING_STEPS = frozenset((
+    WorkflowStep.TRANSCRIBING,
+    WorkflowStep.ENHANCING,
+    WorkflowStep.FORMATTING,
+    WorkflowStep.INSERTING,
+))
+
+# SystemResources fields in constructor order, as stored by the resource
+# history; the integer fields are the network counters, and the averaged
+# fields feed the summary and anonymized export
+RESOURCE_FIELDS = (
+    'timestamp',
+    'cpu_percent',
+    'memory_percent',
+    'memory_used_mb',
+    'disk_usage_percent',
+    'net_bytes_sent',
+    'net_bytes_recv',
+    'net_packets_sent',
+    'net_packets_recv',
+)
+RESOURCE_INT_FIELDS = frozenset(('timestamp', 'net_bytes_sent', 'net_bytes_recv',
+                                 'net_packets_sent', 'net_packets_recv'))
+RESOURCE_AVERAGE_FIELDS = ('cpu_percent', 'memory_percent', 'memory_used_mb', 'disk_usage_percent')
+
+# UsageStatistics fields that are maintained as event counters
+USAGE_COUNTERS = (
+    'total_workflows',
+    'successful_workflows',
+    'failed_workflows',
+    'error_count',
+    'recovery_success_count',
+    'hotkey_presses',
+    'text_insertions',
+)
+
+
 class MetricType(Enum):
     """Types of performance metrics."""
     TIMING = "timing"
@@ -29,23 +109,29 @@ class MetricType(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerformanceMetric:
     """Performance metric data structure."""
-    timestamp: datetime
+    timestamp: int  # Nanoseconds since the epoch (time.time_ns())
     metric_type: MetricType
     name: str
     value: float
     unit: str
     context: Optional[Dict[str, Any]] = None
+    
+    @property
+    def datetime(self) -> datetime:
+        """Timestamp as a local datetime, for display."""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowPerformance:
     """Workflow performance data."""
     workflow_id: str
-    start_time: datetime
-    end_time: Optional[datetime] = None
+    start_time: int  # Nanoseconds since the epoch (time.time_ns())
+    start_time_monotonic_ns: int = field(default_factory=time.monotonic_ns)
+    end_time: Optional[int] = None
     total_duration: Optional[float] = None
     step_durations: Dict[WorkflowStep, float] = None
     success: bool = False
@@ -56,22 +142,26 @@ class WorkflowPerformance:
             self.step_durations = {}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemResources:
     """System resource usage data."""
-    timestamp: datetime
+    timestamp: int  # Nanoseconds since the epoch (time.time_ns())
     cpu_percent: float
     memory_percent: float
     memory_used_mb: float
     disk_usage_percent: float
-    network_io: Dict[str, float] = None
+    net_bytes_sent: int = 0
+    net_bytes_recv: int = 0
+    net_packets_sent: int = 0
+    net_packets_recv: int = 0
     
-    def __post_init__(self):
-        if self.network_io is None:
-            self.network_io = {}
+    @property
+    def datetime(self) -> datetime:
+        """Timestamp as a local datetime, for display."""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageStatistics:
     """Usage statistics data."""
     session_start: datetime
@@ -81,14 +171,19 @@ class UsageStatistics:
     failed_workflows: int = 0
     total_recording_time: float = 0.0
     total_processing_time: float = 0.0
-    average_workflow_duration: float = 0.0
+    total_duration_sum: float = 0.0
     error_count: int = 0
     recovery_success_count: int = 0
     hotkey_presses: int = 0
     text_insertions: int = 0
+    
+    @property
+    def average_workflow_duration(self) -> float:
+        """Average workflow duration, derived from the running sum."""
+        return self.total_duration_sum / max(self.total_workflows, 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyticsData:
     """Analytics data structure for export."""
     session_id: str
@@ -106,6 +201,244 @@ class AnalyticsData:
     export_timestamp: str
 
 
+def _create_usage_counters() -> Dict[str, Iterator[int]]:
+    """
+    Create the usage counters.
+    
+    next() on an itertools.count is a single C call, so it is atomic under
+    the GIL and concurrent increments never draw the same value. Publishing
+    the value is a separate step, see PerformanceMonitor._publish_usage.
+    """
+    return {name: count(1) for name in USAGE_COUNTERS}
+
+
+def _hash_session_start(session_start: datetime) -> str:
+    """Create the anonymized session ID for a session start time."""
+    return hashlib.sha256(session_start.isoformat().encode()).hexdigest()[:8]
+
+
+class _ResourceRing:
+    """
+    Preallocated column-wise ring of resource samples.
+    
+    Each SystemResources field lives in its own NumPy array, so averages over
+    recent samples are single vectorized calls, and SystemResources objects
+    are only built when samples are read back out. A ring keeps every Nth
+    sample, with the monotonic time of each sample alongside.
+    """
+    
+    __slots__ = ('every', 'capacity', 'head', 'size', 'times', 'columns')
+    
+    def __init__(self, every: int, capacity: int):
+        self.every = every
+        self.capacity = capacity
+        self.head = 0
+        self.size = 0
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.columns = {
+            name: np.zeros(capacity, dtype=np.int64 if name in RESOURCE_INT_FIELDS else np.float64)
+            for name in RESOURCE_FIELDS
+        }
+    
+    def append(self, sample_time: float, values: Tuple):
+        """Store one sample, given its values in RESOURCE_FIELDS order."""
+        head = self.head
+        self.times[head] = sample_time
+        for column, value in zip(self.columns.values(), values):
+            column[head] = value
+        self.head = (head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+    
+    def _index(self, count: int) -> np.ndarray:
+        """Ring positions of the newest count samples, oldest first."""
+        return np.arange(self.head - count, self.head) % self.capacity
+    
+    def oldest_time(self) -> Optional[float]:
+        """Monotonic time of the oldest stored sample, or None if empty."""
+        if not self.size:
+            return None
+        return float(self.times[(self.head - self.size) % self.capacity])
+    
+    def recent(self, count: int) -> Dict[str, np.ndarray]:
+        """Copy the newest count values of the averaged columns, oldest first."""
+        index = self._index(min(count, self.size))
+        return {name: self.columns[name][index] for name in RESOURCE_AVERAGE_FIELDS}
+    
+    def columns_since(self, cutoff: float) -> List[np.ndarray]:
+        """Copy every column for the samples taken after the cutoff."""
+        index = self._index(self.size)
+        start = int(np.searchsorted(self.times[index], cutoff, side='right'))
+        index = index[start:]
+        return [column[index] for column in self.columns.values()]
+    
+    def clear(self):
+        self.head = 0
+        self.size = 0
+
+
+def _resources_from_columns(columns: List[np.ndarray]) -> List[SystemResources]:
+    """Build SystemResources objects from column copies taken from a ring."""
+    return [SystemResources(*row) for row in zip(*(column.tolist() for column in columns))]
+
+
+def _column_mean(values: np.ndarray) -> float:
+    """Average a column of samples, or 0.0 if there are none."""
+    return float(values.mean()) if values.size else 0.0
+
+
+def _since(entries: Deque, times: array, cutoff: int) -> list:
+    """
+    Return the entries recorded after the cutoff.
+    
+    times holds the monotonic time in nanoseconds of each entry, kept in
+    lockstep with entries; it is sorted, so the window start is found by
+    binary search over the flat array.
+    """
+    start = bisect_right(times, cutoff)
+    return list(islice(entries, start, None))
+
+
+def _mean(entries: list, attribute: str) -> float:
+    """Average an attribute over the entries, or 0.0 if there are none."""
+    if not entries:
+        return 0.0
+    values = np.fromiter((getattr(entry, attribute) for entry in entries),
+                         dtype=np.float64, count=len(entries))
+    return float(values.mean())
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _to_iso(timestamp_ns: Optional[int]) -> Optional[str]:
+    """Format a time.time_ns() timestamp as an ISO 8601 local time."""
+    if timestamp_ns is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+def _metric_record(metric: PerformanceMetric) -> Dict[str, Any]:
+    """Flat JSON-ready dict for a metric."""
+    return {
+        'timestamp': _to_iso(metric.timestamp),
+        'metric_type': metric.metric_type.value,
+        'name': metric.name,
+        'value': metric.value,
+        'unit': metric.unit,
+        'context': metric.context
+    }
+
+
+def _workflow_record(workflow: WorkflowPerformance) -> Dict[str, Any]:
+    """Flat JSON-ready dict for a workflow."""
+    return {
+        'workflow_id': workflow.workflow_id,
+        'start_time': _to_iso(workflow.start_time),
+        'end_time': _to_iso(workflow.end_time),
+        'total_duration': workflow.total_duration,
+        'step_durations': {step.value: duration for step, duration in workflow.step_durations.items()},
+        'success': workflow.success,
+        'error_message': workflow.error_message
+    }
+
+
+def _resources_record(resources: SystemResources) -> Dict[str, Any]:
+    """Flat JSON-ready dict for a resource sample."""
+    return {
+        'timestamp': _to_iso(resources.timestamp),
+        'cpu_percent': resources.cpu_percent,
+        'memory_percent': resources.memory_percent,
+        'memory_used_mb': resources.memory_used_mb,
+        'disk_usage_percent': resources.disk_usage_percent,
+        'net_bytes_sent': resources.net_bytes_sent,
+        'net_bytes_recv': resources.net_bytes_recv,
+        'net_packets_sent': resources.net_packets_sent,
+        'net_packets_recv': resources.net_packets_recv
+    }
+
+
+def _usage_statistics_record(usage_stats: UsageStatistics) -> Dict[str, Any]:
+    """Flat JSON-ready dict for usage statistics."""
+    return {
+        'session_start': usage_stats.session_start.isoformat(),
+        'session_end': _isoformat(usage_stats.session_end),
+        'total_workflows': usage_stats.total_workflows,
+        'successful_workflows': usage_stats.successful_workflows,
+        'failed_workflows': usage_stats.failed_workflows,
+        'total_recording_time': usage_stats.total_recording_time,
+        'total_processing_time': usage_stats.total_processing_time,
+        'total_duration_sum': usage_stats.total_duration_sum,
+        'average_workflow_duration': usage_stats.average_workflow_duration,
+        'error_count': usage_stats.error_count,
+        'recovery_success_count': usage_stats.recovery_success_count,
+        'hotkey_presses': usage_stats.hotkey_presses,
+        'text_insertions': usage_stats.text_insertions
+    }
+
+
+def _analytics_record(data: AnalyticsData) -> Dict[str, Any]:
+    """Flat JSON-ready dict for an anonymized analytics export."""
+    return {
+        'session_id': data.session_id,
+        'session_duration_hours': data.session_duration_hours,
+        'total_workflows': data.total_workflows,
+        'success_rate': data.success_rate,
+        'average_workflow_duration': data.average_workflow_duration,
+        'total_recording_time_hours': data.total_recording_time_hours,
+        'total_processing_time_hours': data.total_processing_time_hours,
+        'error_rate': data.error_rate,
+        'recovery_success_rate': data.recovery_success_rate,
+        'hotkey_presses': data.hotkey_presses,
+        'text_insertions': data.text_insertions,
+        'system_performance': data.system_performance,
+        'export_timestamp': data.export_timestamp
+    }
+
+
+def _dumps(record: Dict[str, Any]) -> bytes:
+    """Serialize a record as compact JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, default=str)
+    return json.dumps(record, default=str, separators=JSON_SEPARATORS).encode('utf-8')
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Serialize a record as one JSON line, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, default=str, separators=JSON_SEPARATORS) + '\n').encode('utf-8')
+
+
+def _checkpoint_line(kind: str, item) -> bytes:
+    """Serialize one queued checkpoint item as a JSON line."""
+    if kind == 'metric':
+        return _dumps_line({'metric': _metric_record(item)})
+    if kind == 'workflow':
+        return _dumps_line({'workflow': _workflow_record(item)})
+    return _dumps_line({'system_resources': _resources_record(item)})
+
+
+def _write_batched(f, lines: Iterable[bytes]):
+    """
+    Write lines in SAVE_BATCH_BYTES batches, syncing each batch to disk.
+    
+    Spreading the syncs over the export keeps a long session's save from
+    turning into one large burst of dirty pages flushed at close.
+    """
+    batch = bytearray()
+    for line in lines:
+        batch += line
+        if len(batch) >= SAVE_BATCH_BYTES:
+            f.write(batch)
+            f.flush()
+            os.fsync(f.fileno())
+            batch.clear()
+    f.write(batch)
+    f.flush()
+    os.fsync(f.fileno())
+
+
 class PerformanceMonitor:
     """
     Performance monitoring system for tracking application performance.
@@ -142,25 +475,60 @@ class PerformanceMonitor:
         self.include_workflow_timing = True
         self.privacy_mode = True
         
+        # Record network I/O counters even when no resource callback is registered
+        self.collect_network = False
+        
+        # Keep count events (hotkey presses, errors, ...) in the metric history
+        # even when no metric callback is registered
+        self.retain_usage_metrics = False
+        
         # Load analytics settings from config
         if config_manager:
             self._load_analytics_settings()
         
-        # Data storage
-        self.metrics: List[PerformanceMetric] = []
-        self.workflow_performance: List[WorkflowPerformance] = []
-        self.system_resources: List[SystemResources] = []
+        # Data storage (bounded ring buffers, oldest entries are evicted first)
+        self.metrics: Deque[PerformanceMetric] = deque(maxlen=MAX_METRICS)
+        self.workflow_performance: Deque[WorkflowPerformance] = deque(maxlen=MAX_WORKFLOWS)
+        
+        # Resource samples are kept at several resolutions; the first ring
+        # is full resolution
+        self._resource_rings = [_ResourceRing(every, capacity) for every, capacity in RESOURCE_TIERS]
+        self._resource_sample_count = 0
+        
+        # Monotonic times parallel to the workflow history, for time-window lookups
+        self._workflow_times = array('q')
         self.usage_stats = UsageStatistics(session_start=datetime.now())
+        self._usage_counters = _create_usage_counters()
+        # Guards publishing to usage_stats and taking snapshots of it
+        self._usage_lock = threading.Lock()
+        self._session_hash = _hash_session_start(self.usage_stats.session_start)
         
         # Threading
         self.monitoring_thread = None
-        self.stop_monitoring = threading.Event()
+        # Set whenever the monitor thread isn't running
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self.data_lock = threading.Lock()
         
-        # Callbacks
-        self.metric_callbacks: List[Callable[[PerformanceMetric], None]] = []
-        self.resource_callbacks: List[Callable[[SystemResources], None]] = []
-        self.usage_callbacks: List[Callable[[UsageStatistics], None]] = []
+        # Resource samples are handed from the monitor thread to a dispatcher
+        # thread that stores them and runs the callbacks, so slow callbacks
+        # can't delay the next sample
+        self._dispatch_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._dispatcher_thread = None
+        
+        # Metrics are stored by record_metric itself; while the monitor runs,
+        # their callbacks are queued and run in batches on the monitor thread
+        self._metric_inbox: queue.SimpleQueue = queue.SimpleQueue()
+        
+        # Disk usage changes slowly, so it is sampled less often than CPU/memory
+        self._disk_path = os.path.abspath(os.sep)
+        self._disk_usage_percent: Optional[float] = None
+        self._disk_usage_time = 0.0
+        
+        # Callbacks (copy-on-write tuples, safe to iterate without a lock)
+        self.metric_callbacks: Tuple[Callable[[PerformanceMetric], None], ...] = ()
+        self.resource_callbacks: Tuple[Callable[[SystemResources], None], ...] = ()
+        self.usage_callbacks: Tuple[Callable[[UsageStatistics], None], ...] = ()
         
         # Current workflow tracking
         self.current_workflow: Optional[WorkflowPerformance] = None
@@ -168,6 +536,15 @@ class PerformanceMonitor:
         # Analytics storage
         self.analytics_dir = self._get_analytics_directory()
         
+        # While the monitor runs, new records are also queued for the session
+        # checkpoint file, which it appends to every CHECKPOINT_INTERVAL_SECONDS
+        self._checkpoint_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._checkpoint_path = self._get_checkpoint_path(self.usage_stats.session_start)
+        self._last_checkpoint_time = time.monotonic()
+        
+        # Expired checkpoint files are looked for at most once per interval
+        self._last_checkpoint_prune_time: Optional[float] = None
+        
         self.logger.info("PerformanceMonitor initialized")
     
     def _load_analytics_settings(self):
@@ -197,102 +574,194 @@ class PerformanceMonitor:
         os.makedirs(analytics_dir, exist_ok=True)
         return analytics_dir
     
+    def _get_checkpoint_path(self, session_start: datetime) -> str:
+        """Get the checkpoint file for the session starting at session_start."""
+        return os.path.join(self.analytics_dir, f"session_{session_start:%Y%m%d_%H%M%S}.jsonl")
+    
+    def set_enabled(self, enabled: bool):
+        """Enable or disable all performance monitoring and recording at runtime."""
+        self.enabled = enabled
+        self.logger.info(f"Performance monitoring {'enabled' if enabled else 'disabled'}")
+    
     def start_monitoring(self):
         """Start the performance monitoring thread."""
         if self.monitoring_thread and self.monitoring_thread.is_alive():
             self.logger.warning("Monitoring already running")
             return
         
-        self.stop_monitoring.clear()
+        self._stop_event.clear()
+        
+        # Prime the CPU counters so the first non-blocking sample is meaningful
+        psutil.cpu_percent(interval=None)
+        
+        self._dispatcher_thread = threading.Thread(target=self._dispatch_resources, daemon=True)
+        self._dispatcher_thread.start()
+        
         self.monitoring_thread = threading.Thread(target=self._monitor_resources, daemon=True)
         self.monitoring_thread.start()
         self.logger.info("Performance monitoring started")
     
     def stop_monitoring(self):
         """Stop the performance monitoring thread."""
-        self.stop_monitoring.set()
+        self._stop_event.set()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5.0)
+        # Only a live dispatcher gets a sentinel, so a repeated stop can't
+        # leave one behind for the dispatcher of the next start
+        dispatcher, self._dispatcher_thread = self._dispatcher_thread, None
+        if dispatcher and dispatcher.is_alive():
+            # Samples queued before the sentinel are still delivered
+            self._dispatch_queue.put(None)
+            dispatcher.join(timeout=5.0)
+        
+        # Notify callbacks of metrics recorded since the monitor's last tick
+        self._drain_metrics()
         self.logger.info("Performance monitoring stopped")
     
     def _monitor_resources(self):
         """Monitor system resources in background thread."""
-        while not self.stop_monitoring.is_set():
+        # wait() sleeps for the interval but returns True as soon as
+        # stop_monitoring sets the event
+        while not self._stop_event.wait(self.monitoring_interval):
             try:
+                # Read the clocks once per tick and share them below
+                now = time.time_ns()
+                sample_time = time.monotonic()
+                
+                self._drain_metrics()
+                
+                if sample_time - self._last_checkpoint_time >= CHECKPOINT_INTERVAL_SECONDS:
+                    self._last_checkpoint_time = sample_time
+                    self._write_checkpoint()
+                
                 # Only monitor if enabled and system resources are included
-                if not self.performance_monitoring or not self.include_system_resources:
-                    time.sleep(self.monitoring_interval)
+                if not self.enabled or not self.performance_monitoring or not self.include_system_resources:
                     continue
                 
-                # Get system resources
-                cpu_percent = psutil.cpu_percent(interval=0.1)
+                # Get system resources; CPU usage is measured over the time
+                # since the previous call, i.e. the monitoring interval
+                cpu_percent = psutil.cpu_percent(interval=None)
                 memory = psutil.virtual_memory()
-                disk = psutil.disk_usage('/')
-                network = psutil.net_io_counters()
+                disk_percent = self._get_disk_usage_percent(sample_time)
                 
-                # Create resource data
-                resources = SystemResources(
-                    timestamp=datetime.now(),
-                    cpu_percent=cpu_percent,
-                    memory_percent=memory.percent,
-                    memory_used_mb=memory.used / (1024 * 1024),
-                    disk_usage_percent=disk.percent,
-                    network_io={
-                        'bytes_sent': network.bytes_sent,
-                        'bytes_recv': network.bytes_recv,
-                        'packets_sent': network.packets_sent,
-                        'packets_recv': network.packets_recv
-                    }
-                )
+                # Network counters are only read when something consumes them
+                if self.collect_network or self.resource_callbacks:
+                    network = psutil.net_io_counters()
+                    net = (network.bytes_sent, network.bytes_recv,
+                           network.packets_sent, network.packets_recv)
+                else:
+                    net = (0, 0, 0, 0)
                 
-                # Store and notify
-                with self.data_lock:
-                    self.system_resources.append(resources)
+                # Sample values in RESOURCE_FIELDS order
+                values = (now, cpu_percent, memory.percent,
+                          memory.used / (1024 * 1024), disk_percent, *net)
                 
-                # Notify callbacks
-                for callback in self.resource_callbacks:
-                    try:
-                        callback(resources)
-                    except Exception as e:
-                        self.logger.error(f"Resource callback error: {e}")
+                # Hand off to the dispatcher thread for storage and callbacks
+                self._dispatch_queue.put((sample_time, values))
                 
                 # Clean up old data based on retention settings
-                self._cleanup_old_data()
-                
-                time.sleep(self.monitoring_interval)
+                self._cleanup_old_data(now)
                 
             except Exception as e:
                 self.logger.error(f"Error in resource monitoring: {e}")
-                time.sleep(self.monitoring_interval)
     
-    def _cleanup_old_data(self):
+    def _dispatch_resources(self):
+        """Store resource samples and notify callbacks in background thread."""
+        while True:
+            item = self._dispatch_queue.get()
+            if item is None:
+                break
+            
+            sample_time, values = item
+            with self.data_lock:
+                self._resource_sample_count += 1
+                for ring in self._resource_rings:
+                    if self._resource_sample_count % ring.every == 0:
+                        ring.append(sample_time, values)
+            
+            callbacks = self.resource_callbacks
+            if not callbacks and not self.analytics_enabled:
+                continue
+            
+            resources = SystemResources(*values)
+            if self.analytics_enabled:
+                self._checkpoint_queue.put(('system_resources', resources))
+            
+            # Notify callbacks
+            for callback in callbacks:
+                try:
+                    callback(resources)
+                except Exception as e:
+                    self.logger.error(f"Resource callback error: {e}")
+    
+    def _checkpointing(self) -> bool:
+        """Whether new records should be queued for the checkpoint file."""
+        # Only the monitor thread drains the checkpoint queue, so without it
+        # the queue would grow without bound
+        return self.analytics_enabled and not self._stop_event.is_set()
+    
+    def _get_disk_usage_percent(self, now: float) -> float:
+        """Get disk usage, re-reading it at most every DISK_USAGE_REFRESH_SECONDS."""
+        if self._disk_usage_percent is None or now - self._disk_usage_time >= DISK_USAGE_REFRESH_SECONDS:
+            self._disk_usage_percent = psutil.disk_usage(self._disk_path).percent
+            self._disk_usage_time = now
+        return self._disk_usage_percent
+    
+    def _cleanup_old_data(self, now: Optional[int] = None):
         """Clean up old data based on retention settings."""
         if not self.analytics_enabled:
             return
         
-        cutoff_time = datetime.now() - timedelta(days=self.data_retention_days)
+        cutoff_time = (now or time.time_ns()) - self.data_retention_days * NS_PER_DAY
         
+        # Entries are appended in time order, so expired ones are at the left
         with self.data_lock:
             # Clean up metrics
-            self.metrics = [m for m in self.metrics if m.timestamp > cutoff_time]
+            while self.metrics and self.metrics[0].timestamp <= cutoff_time:
+                self.metrics.popleft()
             
             # Clean up workflow performance
-            self.workflow_performance = [w for w in self.workflow_performance 
-                                       if w.end_time and w.end_time > cutoff_time]
+            expired = 0
+            while self.workflow_performance and self.workflow_performance[0].end_time <= cutoff_time:
+                self.workflow_performance.popleft()
+                expired += 1
+            del self._workflow_times[:expired]
             
-            # Clean up system resources (keep last 1000 entries regardless)
-            if len(self.system_resources) > 1000:
-                self.system_resources = self.system_resources[-1000:]
+            # System resources are bounded by the ring buffer size
+        
+        self._prune_checkpoints(cutoff_time)
+    
+    def _prune_checkpoints(self, cutoff_time: int):
+        """Delete session checkpoint files last written before cutoff_time."""
+        now = time.monotonic()
+        if (self._last_checkpoint_prune_time is not None
+                and now - self._last_checkpoint_prune_time < CHECKPOINT_INTERVAL_SECONDS):
+            return
+        self._last_checkpoint_prune_time = now
+        
+        try:
+            with os.scandir(self.analytics_dir) as entries:
+                expired = [
+                    entry.path for entry in entries
+                    if entry.name.startswith('session_') and entry.name.endswith('.jsonl')
+                    and entry.path != self._checkpoint_path
+                    and entry.stat().st_mtime_ns <= cutoff_time
+                ]
+            for path in expired:
+                os.remove(path)
+                self.logger.debug(f"Removed expired analytics checkpoint {path}")
+        except OSError as e:
+            self.logger.error(f"Failed to remove expired analytics checkpoints: {e}")
     
     def record_metric(self, name: str, value: float, unit: str, 
                      metric_type: MetricType = MetricType.TIMING,
                      context: Optional[Dict[str, Any]] = None):
         """Record a performance metric."""
-        if not self.performance_monitoring:
+        if not self.enabled or not self.performance_monitoring:
             return
         
         metric = PerformanceMetric(
-            timestamp=datetime.now(),
+            timestamp=time.time_ns(),
             metric_type=metric_type,
             name=name,
             value=value,
@@ -300,33 +769,53 @@ class PerformanceMonitor:
             context=context
         )
         
-        with self.data_lock:
-            self.metrics.append(metric)
+        # deque.append is atomic, and readers copy the deque with a single
+        # list() call, so this doesn't need the lock
+        self.metrics.append(metric)
+        if self._checkpointing():
+            self._checkpoint_queue.put(('metric', metric))
         
-        # Notify callbacks
-        for callback in self.metric_callbacks:
-            try:
-                callback(metric)
-            except Exception as e:
-                self.logger.error(f"Metric callback error: {e}")
+        if self.metric_callbacks:
+            self._metric_inbox.put(metric)
+            # Without a running monitor thread nothing else drains the inbox
+            if self._stop_event.is_set():
+                self._drain_metrics()
         
-        self.logger.debug(f"Recorded metric: {name} = {value} {unit}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Recorded metric: %s = %s %s", name, value, unit)
+    
+    def _drain_metrics(self):
+        """Notify callbacks of queued metrics, one batch at a time."""
+        batch = []
+        try:
+            while True:
+                batch.append(self._metric_inbox.get_nowait())
+        except queue.Empty:
+            pass
+        
+        callbacks = self.metric_callbacks
+        for metric in batch:
+            for callback in callbacks:
+                try:
+                    callback(metric)
+                except Exception as e:
+                    self.logger.error(f"Metric callback error: {e}")
     
     def start_workflow_tracking(self, workflow_id: str):
         """Start tracking a new workflow."""
-        if not self.include_workflow_timing:
+        if not self.enabled or not self.include_workflow_timing:
             return
         
         self.current_workflow = WorkflowPerformance(
             workflow_id=workflow_id,
-            start_time=datetime.now()
+            start_time=time.time_ns()
         )
         
         self.logger.info(f"Started tracking workflow: {workflow_id}")
     
     def record_workflow_step(self, step: WorkflowStep, duration: float):
         """Record the duration of a workflow step."""
-        if not self.include_workflow_timing or not self.current_workflow:
+        if not self.enabled or not self.include_workflow_timing or not self.current_workflow:
             return
         
         self.current_workflow.step_durations[step] = duration
@@ -334,19 +823,27 @@ class PerformanceMonitor:
     
     def end_workflow_tracking(self, success: bool, error_message: Optional[str] = None):
         """End tracking the current workflow."""
-        if not self.include_workflow_timing or not self.current_workflow:
+        if not self.enabled or not self.include_workflow_timing or not self.current_workflow:
             return
         
-        self.current_workflow.end_time = datetime.now()
-        self.current_workflow.total_duration = (
-            self.current_workflow.end_time - self.current_workflow.start_time
-        ).total_seconds()
+        # Durations use the monotonic clock so wall-clock adjustments don't
+        # skew them; the end time is derived from the same single clock read
+        end_time_monotonic_ns = time.monotonic_ns()
+        duration_ns = end_time_monotonic_ns - self.current_workflow.start_time_monotonic_ns
+        self.current_workflow.end_time = self.current_workflow.start_time + duration_ns
+        self.current_workflow.total_duration = duration_ns / 1e9
         self.current_workflow.success = success
         self.current_workflow.error_message = error_message
         
         # Store workflow performance
         with self.data_lock:
+            # The deque drops its oldest entry when full; keep the times in step
+            if len(self.workflow_performance) == self.workflow_performance.maxlen:
+                del self._workflow_times[0]
             self.workflow_performance.append(self.current_workflow)
+            self._workflow_times.append(end_time_monotonic_ns)
+        if self._checkpointing():
+            self._checkpoint_queue.put(('workflow', self.current_workflow))
         
         # Update usage statistics
         if self.usage_statistics:
@@ -359,183 +856,275 @@ class PerformanceMonitor:
     
     def _update_usage_stats(self, workflow: WorkflowPerformance):
         """Update usage statistics with workflow data."""
-        self.usage_stats.total_workflows += 1
+        self._increment_usage('total_workflows')
         
         if workflow.success:
-            self.usage_stats.successful_workflows += 1
+            self._increment_usage('successful_workflows')
         else:
-            self.usage_stats.failed_workflows += 1
+            self._increment_usage('failed_workflows')
             if self.error_tracking:
-                self.usage_stats.error_count += 1
+                self._increment_usage('error_count')
         
-        if workflow.total_duration:
-            self.usage_stats.average_workflow_duration = (
-                (self.usage_stats.average_workflow_duration * (self.usage_stats.total_workflows - 1) +
-                 workflow.total_duration) / self.usage_stats.total_workflows
-            )
-        
-        # Update step-specific times
-        if WorkflowStep.RECORDING in workflow.step_durations:
-            self.usage_stats.total_recording_time += workflow.step_durations[WorkflowStep.RECORDING]
+        with self._usage_lock:
+            usage_stats = self.usage_stats
+            if workflow.total_duration:
+                usage_stats.total_duration_sum += workflow.total_duration
+            
+            # Update step-specific times
+            for step, duration in workflow.step_durations.items():
+                if step is WorkflowStep.RECORDING:
+                    usage_stats.total_recording_time += duration
+                elif step in PROCESSING_STEPS:
+                    usage_stats.total_processing_time += duration
+    
+    def _increment_usage(self, name: str):
+        """Increment a usage counter and publish the new total."""
+        counters = self._usage_counters
+        self._publish_usage(counters, name, next(counters[name]))
+    
+    def _publish_usage(self, counters: Dict[str, Iterator[int]], name: str, value: int):
+        """
+        Publish a value drawn from a usage counter to usage_stats.
         
-        processing_steps = [WorkflowStep.TRANSCRIBING, WorkflowStep.ENHANCING, 
-                          WorkflowStep.FORMATTING, WorkflowStep.INSERTING]
-        for step in processing_steps:
-            if step in workflow.step_durations:
-                self.usage_stats.total_processing_time += workflow.step_durations[step]
+        Another thread may draw and publish a later value between drawing
+        this one and getting here, so only a larger value is written; values
+        from counters replaced by clear_data are dropped.
+        """
+        with self._usage_lock:
+            if counters is self._usage_counters and value > getattr(self.usage_stats, name):
+                setattr(self.usage_stats, name, value)
     
     def record_hotkey_press(self):
         """Record a hotkey press event."""
-        if not self.usage_statistics:
+        if not self.enabled or not self.usage_statistics:
             return
         
-        self.usage_stats.hotkey_presses += 1
-        self.record_metric("hotkey_press", 1, "count", MetricType.USAGE)
+        self._increment_usage('hotkey_presses')
+        if self.retain_usage_metrics or self.metric_callbacks:
+            self.record_metric("hotkey_press", 1, "count", MetricType.USAGE)
     
     def record_text_insertion(self):
         """Record a text insertion event."""
-        if not self.usage_statistics:
+        if not self.enabled or not self.usage_statistics:
             return
         
-        self.usage_stats.text_insertions += 1
-        self.record_metric("text_insertion", 1, "count", MetricType.USAGE)
+        self._increment_usage('text_insertions')
+        if self.retain_usage_metrics or self.metric_callbacks:
+            self.record_metric("text_insertion", 1, "count", MetricType.USAGE)
     
     def record_error(self):
         """Record an error event."""
-        if not self.error_tracking:
+        if not self.enabled or not self.error_tracking:
             return
         
-        self.usage_stats.error_count += 1
-        self.record_metric("error", 1, "count", MetricType.ERROR)
+        self._increment_usage('error_count')
+        if self.retain_usage_metrics or self.metric_callbacks:
+            self.record_metric("error", 1, "count", MetricType.ERROR)
     
     def record_recovery_success(self):
         """Record a successful recovery event."""
-        if not self.error_tracking:
+        if not self.enabled or not self.error_tracking:
             return
         
-        self.usage_stats.recovery_success_count += 1
-        self.record_metric("recovery_success", 1, "count", MetricType.USAGE)
+        self._increment_usage('recovery_success_count')
+        if self.retain_usage_metrics or self.metric_callbacks:
+            self.record_metric("recovery_success", 1, "count", MetricType.USAGE)
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get a summary of performance data."""
+        now = datetime.now()
+        cutoff = time.monotonic_ns() - 3600 * 10**9
+        
+        # Snapshot under the lock, then aggregate without blocking writers
         with self.data_lock:
-            recent_workflows = [w for w in self.workflow_performance 
-                              if w.end_time and (datetime.now() - w.end_time).seconds < 3600]
-            
-            if recent_workflows:
-                avg_duration = sum(w.total_duration for w in recent_workflows) / len(recent_workflows)
-                success_rate = sum(1 for w in recent_workflows if w.success) / len(recent_workflows) * 100
-            else:
-                avg_duration = 0.0
-                success_rate = 0.0
-            
-            # Get recent system resources
-            recent_resources = self.system_resources[-10:] if self.system_resources else []
-            avg_cpu = sum(r.cpu_percent for r in recent_resources) / len(recent_resources) if recent_resources else 0.0
-            avg_memory = sum(r.memory_percent for r in recent_resources) / len(recent_resources) if recent_resources else 0.0
-            
-            return {
-                'total_workflows': self.usage_stats.total_workflows,
-                'success_rate': success_rate,
-                'average_duration': avg_duration,
-                'recent_workflows': len(recent_workflows),
-                'average_cpu_usage': avg_cpu,
-                'average_memory_usage': avg_memory,
-                'session_duration': (datetime.now() - self.usage_stats.session_start).total_seconds(),
-                'hotkey_presses': self.usage_stats.hotkey_presses,
-                'text_insertions': self.usage_stats.text_insertions,
-                'error_count': self.usage_stats.error_count,
-                'recovery_success_count': self.usage_stats.recovery_success_count
-            }
+            recent_workflows = _since(self.workflow_performance, self._workflow_times, cutoff)
+            recent_resources = self._resource_rings[0].recent(10)
+        
+        usage_stats = self.get_usage_statistics()
+        
+        avg_duration = _mean(recent_workflows, 'total_duration')
+        success_rate = _mean(recent_workflows, 'success') * 100
+        
+        # Get recent system resources
+        avg_cpu = _column_mean(recent_resources['cpu_percent'])
+        avg_memory = _column_mean(recent_resources['memory_percent'])
+        
+        return {
+            'total_workflows': usage_stats.total_workflows,
+            'success_rate': success_rate,
+            'average_duration': avg_duration,
+            'recent_workflows': len(recent_workflows),
+            'average_cpu_usage': avg_cpu,
+            'average_memory_usage': avg_memory,
+            'session_duration': (now - usage_stats.session_start).total_seconds(),
+            'hotkey_presses': usage_stats.hotkey_presses,
+            'text_insertions': usage_stats.text_insertions,
+            'error_count': usage_stats.error_count,
+            'recovery_success_count': usage_stats.recovery_success_count
+        }
     
     def get_workflow_performance(self, hours: int = 24) -> List[WorkflowPerformance]:
         """Get workflow performance data for the specified time period."""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
+        cutoff = time.monotonic_ns() - hours * 3600 * 10**9
         
         with self.data_lock:
-            return [w for w in self.workflow_performance 
-                   if w.end_time and w.end_time > cutoff_time]
+            return _since(self.workflow_performance, self._workflow_times, cutoff)
+    
+    @property
+    def system_resources(self) -> List[SystemResources]:
+        """Full-resolution resource history, oldest first."""
+        with self.data_lock:
+            columns = self._resource_rings[0].columns_since(float('-inf'))
+        return _resources_from_columns(columns)
     
     def get_system_resources(self, minutes: int = 60) -> List[SystemResources]:
-        """Get system resource data for the specified time period."""
-        cutoff_time = datetime.now() - timedelta(minutes=minutes)
+        """
+        Get system resource data for the specified time period.
+        
+        Samples come from the finest-resolution history that reaches back to
+        the start of the period, or from the one reaching back furthest.
+        """
+        cutoff = time.monotonic() - minutes * 60
         
         with self.data_lock:
-            return [r for r in self.system_resources if r.timestamp > cutoff_time]
+            selected = self._resource_rings[0]
+            for ring in self._resource_rings:
+                oldest = ring.oldest_time()
+                if oldest is None:
+                    continue
+                if oldest <= cutoff:
+                    selected = ring
+                    break
+                selected_oldest = selected.oldest_time()
+                if selected_oldest is not None and oldest < selected_oldest:
+                    selected = ring
+            columns = selected.columns_since(cutoff)
+        
+        return _resources_from_columns(columns)
     
     def get_usage_statistics(self) -> UsageStatistics:
-        """Get current usage statistics."""
-        return self.usage_stats
+        """Get a snapshot of the current usage statistics."""
+        with self._usage_lock:
+            return replace(self.usage_stats)
     
     def add_metric_callback(self, callback: Callable[[PerformanceMetric], None]):
         """Add callback for metric notifications."""
-        self.metric_callbacks.append(callback)
+        self.metric_callbacks = self.metric_callbacks + (callback,)
     
     def add_resource_callback(self, callback: Callable[[SystemResources], None]):
         """Add callback for resource notifications."""
-        self.resource_callbacks.append(callback)
+        self.resource_callbacks = self.resource_callbacks + (callback,)
     
     def add_usage_callback(self, callback: Callable[[UsageStatistics], None]):
         """Add callback for usage statistics notifications."""
-        self.usage_callbacks.append(callback)
+        self.usage_callbacks = self.usage_callbacks + (callback,)
     
     def export_anonymized_data(self) -> AnalyticsData:
         """Export anonymized usage data for analysis."""
         if not self.anonymized_export:
             raise ValueError("Anonymized export is not enabled")
         
-        # Create anonymized session ID
-        session_hash = hashlib.sha256(
-            self.usage_stats.session_start.isoformat().encode()
-        ).hexdigest()[:8]
+        with self.data_lock:
+            recent_resources = self._resource_rings[0].recent(100)
+            usage_stats = self.get_usage_statistics()
+            session_hash = self._session_hash
+        
+        now = datetime.now()
         
         # Calculate system performance averages
-        recent_resources = self.system_resources[-100:] if self.system_resources else []
         system_performance = {
-            'avg_cpu_percent': sum(r.cpu_percent for r in recent_resources) / len(recent_resources) if recent_resources else 0.0,
-            'avg_memory_percent': sum(r.memory_percent for r in recent_resources) / len(recent_resources) if recent_resources else 0.0,
-            'avg_memory_used_mb': sum(r.memory_used_mb for r in recent_resources) / len(recent_resources) if recent_resources else 0.0,
-            'avg_disk_usage_percent': sum(r.disk_usage_percent for r in recent_resources) / len(recent_resources) if recent_resources else 0.0
+            f'avg_{name}': _column_mean(values) for name, values in recent_resources.items()
         }
         
         return AnalyticsData(
             session_id=session_hash,
-            session_duration_hours=(datetime.now() - self.usage_stats.session_start).total_seconds() / 3600,
-            total_workflows=self.usage_stats.total_workflows,
-            success_rate=(self.usage_stats.successful_workflows / max(self.usage_stats.total_workflows, 1)) * 100,
-            average_workflow_duration=self.usage_stats.average_workflow_duration,
-            total_recording_time_hours=self.usage_stats.total_recording_time / 3600,
-            total_processing_time_hours=self.usage_stats.total_processing_time / 3600,
-            error_rate=(self.usage_stats.error_count / max(self.usage_stats.total_workflows, 1)) * 100,
-            recovery_success_rate=(self.usage_stats.recovery_success_count / max(self.usage_stats.error_count, 1)) * 100,
-            hotkey_presses=self.usage_stats.hotkey_presses,
-            text_insertions=self.usage_stats.text_insertions,
+            session_duration_hours=(now - usage_stats.session_start).total_seconds() / 3600,
+            total_workflows=usage_stats.total_workflows,
+            success_rate=(usage_stats.successful_workflows / max(usage_stats.total_workflows, 1)) * 100,
+            average_workflow_duration=usage_stats.average_workflow_duration,
+            total_recording_time_hours=usage_stats.total_recording_time / 3600,
+            total_processing_time_hours=usage_stats.total_processing_time / 3600,
+            error_rate=(usage_stats.error_count / max(usage_stats.total_workflows, 1)) * 100,
+            recovery_success_rate=(usage_stats.recovery_success_count / max(usage_stats.error_count, 1)) * 100,
+            hotkey_presses=usage_stats.hotkey_presses,
+            text_insertions=usage_stats.text_insertions,
             system_performance=system_performance,
-            export_timestamp=datetime.now().isoformat()
+            export_timestamp=now.isoformat()
         )
     
+    def _write_checkpoint(self):
+        """
+        Append the records queued since the last checkpoint to the session file.
+        
+        Each checkpoint starts with a line holding the usage statistics at
+        that point, followed by one line per new record.
+        """
+        items = []
+        try:
+            while True:
+                items.append(self._checkpoint_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if not items:
+            return
+        
+        header = {
+            'checkpoint': {
+                'usage_statistics': _usage_statistics_record(self.get_usage_statistics()),
+                'export_timestamp': datetime.now().isoformat()
+            }
+        }
+        lines = chain(
+            (_dumps_line(header),),
+            (_checkpoint_line(kind, item) for kind, item in items)
+        )
+        
+        try:
+            with open(self._checkpoint_path, 'ab') as f:
+                _write_batched(f, lines)
+            self.logger.debug(f"Checkpointed {len(items)} analytics records to {self._checkpoint_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to write analytics checkpoint: {e}")
+    
     def save_analytics_data(self, filename: Optional[str] = None) -> str:
-        """Save analytics data to file."""
+        """
+        Save analytics data to a JSON Lines file.
+        
+        The first line holds the usage statistics and export timestamp; every
+        following line is a single metric, workflow or resource sample record,
+        so the file is written record by record without building one large
+        document in memory.
+        """
         if not self.analytics_enabled:
             raise ValueError("Analytics is not enabled")
         
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"analytics_{timestamp}.json"
+            filename = f"analytics_{timestamp}.jsonl"
         
         filepath = os.path.join(self.analytics_dir, filename)
         
+        with self.data_lock:
+            metrics = list(self.metrics)
+            workflows = list(self.workflow_performance)
+            resource_columns = self._resource_rings[0].columns_since(float('-inf'))
+            usage_stats = self.get_usage_statistics()
+        
         try:
-            data = {
-                'metrics': [asdict(m) for m in self.metrics],
-                'workflow_performance': [asdict(w) for w in self.workflow_performance],
-                'system_resources': [asdict(r) for r in self.system_resources],
-                'usage_statistics': asdict(self.usage_stats),
+            header = {
+                'usage_statistics': _usage_statistics_record(usage_stats),
                 'export_timestamp': datetime.now().isoformat()
             }
-            
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            lines = chain(
+                (_dumps_line(header),),
+                (_dumps_line({'metric': _metric_record(m)}) for m in metrics),
+                (_dumps_line({'workflow': _workflow_record(w)}) for w in workflows),
+                (_dumps_line({'system_resources': _resources_record(r)})
+                 for r in _resources_from_columns(resource_columns))
+            )
+            with open(filepath, 'wb') as f:
+                _write_batched(f, lines)
             
             self.logger.info(f"Analytics data saved to {filepath}")
             return filepath
@@ -558,8 +1147,8 @@ class PerformanceMonitor:
         try:
             data = self.export_anonymized_data()
             
-            with open(filepath, 'w') as f:
-                json.dump(asdict(data), f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps(_analytics_record(data)))
             
             self.logger.info(f"Anonymized report saved to {filepath}")
             return filepath
@@ -570,11 +1159,21 @@ class PerformanceMonitor:
     
     def clear_data(self):
         """Clear all performance data."""
+        # Records already queued belong to the session being cleared
+        self._write_checkpoint()
+        
         with self.data_lock:
             self.metrics.clear()
             self.workflow_performance.clear()
-            self.system_resources.clear()
-            self.usage_stats = UsageStatistics(session_start=datetime.now())
+            for ring in self._resource_rings:
+                ring.clear()
+            self._resource_sample_count = 0
+            del self._workflow_times[:]
+            with self._usage_lock:
+                self.usage_stats = UsageStatistics(session_start=datetime.now())
+                self._usage_counters = _create_usage_counters()
+            self._session_hash = _hash_session_start(self.usage_stats.session_start)
+            self._checkpoint_path = self._get_checkpoint_path(self.usage_stats.session_start)
         
         self.logger.info("Performance data cleared")
     
@@ -589,17 +1188,13 @@ class PerformanceMonitor:
             # End current session
             self.usage_stats.session_end = datetime.now()
             
-            # Save final analytics data if enabled
-            if self.analytics_enabled:
-                try:
-                    self.save_analytics_data("final_session_data.json")
-                except Exception as e:
-                    self.logger.error(f"Failed to save final analytics data: {e}")
+            # Most of the session is already checkpointed; write the tail
+            self._write_checkpoint()
             
             # Clear callbacks
-            self.metric_callbacks.clear()
-            self.resource_callbacks.clear()
-            self.usage_callbacks.clear()
+            self.metric_callbacks = ()
+            self.resource_callbacks = ()
+            self.usage_callbacks = ()
             
             self.logger.info("Performance monitor shutdown completed")
             
@@ -610,54 +1205,74 @@ class PerformanceMonitor:
 class PerformanceReporter:
     """Performance reporting and analysis system."""
     
-    def __init__(self, monitor: PerformanceMonitor):
-        self.logger = logging.getLogger(__name__)
-        self.monitor = monitor
+    # Seconds a performance summary is reused across report generations
+    SUMMARY_TTL_SECONDS = 1.0
     
-    def generate_performance_report(self) -> str:
-        """Generate a human-readable performance report."""
-        summary = self.monitor.get_performance_summary()
-        
-        report = f"""
-Performance Report - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-{'=' * 50}
+    REPORT_TEMPLATE = """
+Performance Report - {generated_at}
+==================================================
 
 Session Information:
-- Session Duration: {summary['session_duration']:.1f} seconds
-- Total Workflows: {summary['total_workflows']}
-- Success Rate: {summary['success_rate']:.1f}%
-- Average Workflow Duration: {summary['average_duration']:.3f} seconds
+- Session Duration: {session_duration:.1f} seconds
+- Total Workflows: {total_workflows}
+- Success Rate: {success_rate:.1f}%
+- Average Workflow Duration: {average_duration:.3f} seconds
 
 Recent Activity (Last Hour):
-- Recent Workflows: {summary['recent_workflows']}
-- Hotkey Presses: {summary['hotkey_presses']}
-- Text Insertions: {summary['text_insertions']}
+- Recent Workflows: {recent_workflows}
+- Hotkey Presses: {hotkey_presses}
+- Text Insertions: {text_insertions}
 
 System Performance:
-- Average CPU Usage: {summary['average_cpu_usage']:.1f}%
-- Average Memory Usage: {summary['average_memory_usage']:.1f}%
+- Average CPU Usage: {average_cpu_usage:.1f}%
+- Average Memory Usage: {average_memory_usage:.1f}%
 
 Error Handling:
-- Total Errors: {summary['error_count']}
-- Recovery Successes: {summary['recovery_success_count']}
+- Total Errors: {error_count}
+- Recovery Successes: {recovery_success_count}
 
 Analytics Settings:
-- Analytics Enabled: {self.monitor.analytics_enabled}
-- Performance Monitoring: {self.monitor.performance_monitoring}
-- Usage Statistics: {self.monitor.usage_statistics}
-- Error Tracking: {self.monitor.error_tracking}
-- Privacy Mode: {self.monitor.privacy_mode}
+- Analytics Enabled: {analytics_enabled}
+- Performance Monitoring: {performance_monitoring}
+- Usage Statistics: {usage_statistics}
+- Error Tracking: {error_tracking}
+- Privacy Mode: {privacy_mode}
 """
-        
-        return report
+    
+    def __init__(self, monitor: PerformanceMonitor):
+        self.logger = logging.getLogger(__name__)
+        self.monitor = monitor
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._summary_cache_time = 0.0
+    
+    def _get_summary(self) -> Dict[str, Any]:
+        """Get the monitor summary, reusing a recent one within the TTL."""
+        now = time.monotonic()
+        if self._summary_cache is None or now - self._summary_cache_time > self.SUMMARY_TTL_SECONDS:
+            self._summary_cache = self.monitor.get_performance_summary()
+            self._summary_cache_time = now
+        return self._summary_cache
+    
+    def generate_performance_report(self) -> str:
+        """Generate a human-readable performance report."""
+        monitor = self.monitor
+        return self.REPORT_TEMPLATE.format(
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            analytics_enabled=monitor.analytics_enabled,
+            performance_monitoring=monitor.performance_monitoring,
+            usage_statistics=monitor.usage_statistics,
+            error_tracking=monitor.error_tracking,
+            privacy_mode=monitor.privacy_mode,
+            **self._get_summary()
+        )
     
     def export_anonymized_report(self, filepath: str):
         """Export anonymized performance report."""
         try:
             data = self.monitor.export_anonymized_data()
             
-            with open(filepath, 'w') as f:
-                json.dump(asdict(data), f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(_dumps(_analytics_record(data)))
             
             self.logger.info(f"Anonymized report exported to {filepath}")
             
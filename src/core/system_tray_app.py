@@ -7,22 +7,15 @@ status indicators, and quick access to settings and controls.
 
 import os
 import sys
+import queue
 import threading
 import logging
-from typing import Optional, Dict, Callable
+import hashlib
+import tempfile
+import importlib.util
+from typing import Optional, Dict, Callable, List, Tuple
 from pathlib import Path
 
-try:
-    from pystray import Icon, Menu, MenuItem
-    from PIL import Image, ImageDraw
-    import win10toast
-    PYSYSTRAY_AVAILABLE = True
-except ImportError:
-    PYSYSTRAY_AVAILABLE = False
-    Icon = Menu = MenuItem = None
-    Image = ImageDraw = None
-    win10toast = None
-
 from .types import ApplicationState
 from typing import TYPE_CHECKING
 
@@ -30,6 +23,184 @@ if TYPE_CHECKING:
     from .application_controller import ApplicationController
 
 
+# pystray, PIL and win10toast are slow to import (win10toast pulls in
+# pywin32), so they are only imported once a tray app is actually created
+Icon = Menu = MenuItem = None
+Image = ImageDraw = None
+win10toast = None
+toast_notifications = None
+_tray_modules_loaded: Optional[bool] = None
+_win10toast_loaded: Optional[bool] = None
+_winsdk_toasts_loaded: Optional[bool] = None
+
+# Tray icons by state, shared by every SystemTrayApp and loaded by the first
+_icon_cache: Optional[Dict[ApplicationState, "Image.Image"]] = None
+_icon_cache_lock = threading.Lock()
+
+# Notifications raised within this many seconds are shown as a single toast
+NOTIFICATION_COALESCE_SECONDS = 0.5
+
+# Tray tooltip for each application state
+STATE_TITLES = {
+    state: f"Voice Dictation Assistant - {state.value.title()}" for state in ApplicationState
+}
+
+ABOUT_TEXT = """
+Voice Dictation Assistant
+Version 1.0.0
+
+A powerful voice dictation tool that uses AI to enhance your speech-to-text experience.
+
+Features:
+• Real-time speech recognition
+• AI-powered text enhancement
+• Context-aware formatting
+• Performance monitoring and analytics
+• Privacy-focused design
+
+For support and updates, visit the project repository.
+""".strip()
+
+# Default tray icons as (state, background colour, dot colour), drawn when
+# the resources directory has no icons
+DEFAULT_ICON_SIZE = (32, 32)
+DEFAULT_ICON_DOT_BOUNDS = (8, 8, 24, 24)
+DEFAULT_ICON_SPEC = (
+    (ApplicationState.IDLE, (128, 128, 128, 255), (200, 200, 200, 255)),
+    (ApplicationState.RECORDING, (255, 0, 0, 255), (255, 100, 100, 255)),
+    (ApplicationState.PROCESSING, (0, 0, 255, 255), (100, 100, 255, 255)),
+    (ApplicationState.ERROR, (255, 165, 0, 255), (255, 200, 100, 255)),
+    (ApplicationState.CONFIGURING, (255, 255, 0, 255), (255, 255, 100, 255)),
+)
+
+
+def is_pystray_available() -> bool:
+    """Check whether pystray is installed, without importing it."""
+    return importlib.util.find_spec("pystray") is not None
+
+
+def _with_cached_icon_handles(base):
+    """
+    Subclass pystray's win32 Icon to keep one icon handle per image.
+    
+    The win32 backend writes the image to a temporary ICO file and loads a
+    new handle every time the icon changes. The tray only switches between a
+    few fixed images, so each handle is loaded once and reused, and all of
+    them are destroyed when the icon stops.
+    """
+    from pystray._util import win32
+    
+    class CachedHandleIcon(base):
+        def __init__(self, *args, **kwargs):
+            self._icon_handles = {}
+            super().__init__(*args, **kwargs)
+        
+        def _assert_icon_handle(self):
+            if self._icon_handle:
+                return
+            handle = self._icon_handles.get(id(self.icon))
+            if handle is None:
+                super()._assert_icon_handle()
+                self._icon_handles[id(self.icon)] = self._icon_handle
+            else:
+                self._icon_handle = handle
+        
+        def _release_icon(self):
+            # The handle stays cached in _icon_handles until stop()
+            self._icon_handle = None
+        
+        def stop(self):
+            super().stop()
+            for handle in self._icon_handles.values():
+                win32.DestroyIcon(handle)
+            self._icon_handles.clear()
+    
+    return CachedHandleIcon
+
+
+def _load_tray_modules() -> bool:
+    """Import pystray and PIL on first use; return whether both are available."""
+    global _tray_modules_loaded, Icon, Menu, MenuItem, Image, ImageDraw
+    if _tray_modules_loaded is None:
+        try:
+            from pystray import Icon, Menu, MenuItem
+            from PIL import Image, ImageDraw
+            if hasattr(Icon, '_assert_icon_handle'):
+                Icon = _with_cached_icon_handles(Icon)
+            _tray_modules_loaded = True
+        except Exception:
+            # pystray picks a platform backend on import, which can fail with
+            # more than ImportError (e.g. no display on Linux)
+            _tray_modules_loaded = False
+    return _tray_modules_loaded
+
+
+def _default_icon_cache_dir() -> Path:
+    """Directory holding the rendered default icons, keyed by their spec."""
+    spec = repr((DEFAULT_ICON_SIZE, DEFAULT_ICON_DOT_BOUNDS,
+                 [(state.value, bg, fg) for state, bg, fg in DEFAULT_ICON_SPEC]))
+    digest = hashlib.sha256(spec.encode()).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / "voice_tray_icons" / digest
+
+
+def _read_icon(path: Path) -> "Image.Image":
+    """Open an icon image and decode it now, so its file is closed on return."""
+    with Image.open(path) as image:
+        image.load()
+    return image
+
+
+def _load_win10toast() -> bool:
+    """Import win10toast on first use; return whether it is available."""
+    global _win10toast_loaded, win10toast
+    if _win10toast_loaded is None:
+        try:
+            import win10toast
+            _win10toast_loaded = True
+        except ImportError:
+            _win10toast_loaded = False
+    return _win10toast_loaded
+
+
+def _load_winsdk_toasts() -> bool:
+    """Import the WinRT toast API from winsdk on first use; return whether it is available."""
+    global _winsdk_toasts_loaded, toast_notifications
+    if _winsdk_toasts_loaded is None:
+        try:
+            import winsdk.windows.ui.notifications as toast_notifications
+            _winsdk_toasts_loaded = True
+        except ImportError:
+            _winsdk_toasts_loaded = False
+    return _winsdk_toasts_loaded
+
+
+class _WinRTToastNotifier:
+    """
+    Show toasts through the native WinRT notification API.
+    
+    Offers win10toast's show_toast signature. Toasts are handed straight to
+    the OS notification queue instead of each getting its own thread and
+    hidden window; how long a toast stays up is decided by Windows, so
+    duration is ignored.
+    
+    app_id must be a registered AppUserModelID (e.g. the one set on the
+    app's Start-menu shortcut): Windows accepts toasts from an unregistered
+    id without error but never displays them.
+    """
+    
+    def __init__(self, app_id: str):
+        manager = toast_notifications.ToastNotificationManager
+        self._notifier = manager.create_toast_notifier(app_id)
+    
+    def show_toast(self, title: str, message: str, duration: int = 5, threaded: bool = False):
+        manager = toast_notifications.ToastNotificationManager
+        xml = manager.get_template_content(toast_notifications.ToastTemplateType.TOAST_TEXT02)
+        text_nodes = xml.get_elements_by_tag_name("text")
+        text_nodes.item(0).append_child(xml.create_text_node(title))
+        text_nodes.item(1).append_child(xml.create_text_node(message))
+        self._notifier.show(toast_notifications.ToastNotification(xml))
+
+
 class SystemTrayApp:
     """
     System tray application with visual feedback and menu controls.
@@ -44,7 +215,8 @@ class SystemTrayApp:
     def __init__(self, toggle_recording_callback: Callable,
                  show_analytics_callback: Callable,
                  show_config_callback: Callable,
-                 shutdown_callback: Callable):
+                 shutdown_callback: Callable,
+                 toast_app_id: Optional[str] = None):
         """
         Initialize the system tray application.
         
@@ -53,6 +225,8 @@ class SystemTrayApp:
             show_analytics_callback: Callback for showing analytics dashboard
             show_config_callback: Callback for showing configuration
             shutdown_callback: Callback for shutting down the application
+            toast_app_id: Registered AppUserModelID to show native WinRT
+                toasts under; without one, win10toast is used
         """
         self.logger = logging.getLogger(__name__)
         
@@ -66,80 +240,106 @@ class SystemTrayApp:
         self.current_state = ApplicationState.IDLE
         self.notifier = None
         
+        # State changes are applied to the icon by a single updater thread,
+        # so callers never block on (or race in) the tray backend
+        self._state_updates: queue.SimpleQueue = queue.SimpleQueue()
+        self._updater_thread: Optional[threading.Thread] = None
+        
+        # Notifications waiting to be shown as one coalesced toast
+        self._pending_notifications: List[Tuple[str, str, int]] = []
+        self._notification_timer: Optional[threading.Timer] = None
+        self._notification_lock = threading.Lock()
+        
         # Initialize icon images
-        self.icons = {}
-        self._load_icons()
+        self.icons = self._get_icons() if _load_tray_modules() else {}
+        
+        # (icon, title) per state, so a state change is a single lookup
+        self._state_display = {
+            state: (icon, STATE_TITLES[state]) for state, icon in self.icons.items()
+        }
         
-        # Setup notification system
-        if win10toast:
+        # Setup notification system. Native WinRT toasts need a registered
+        # app id, since toasts from an unregistered one are silently dropped.
+        if toast_app_id and _load_winsdk_toasts():
+            try:
+                self.notifier = _WinRTToastNotifier(toast_app_id)
+            except Exception as e:
+                self.logger.warning(f"WinRT notifications unavailable: {e}")
+        if not self.notifier and _load_win10toast():
             self.notifier = win10toast.ToastNotifier()
         
         self.logger.info("System tray application initialized")
     
-    def _load_icons(self):
+    def _get_icons(self) -> Dict[ApplicationState, "Image.Image"]:
+        """Get the shared tray icons, loading them on first use."""
+        global _icon_cache
+        with _icon_cache_lock:
+            if _icon_cache is None:
+                _icon_cache = self._load_icons()
+            return _icon_cache
+    
+    def _load_icons(self) -> Dict[ApplicationState, "Image.Image"]:
         """Load or create system tray icons for different states."""
         try:
             # Try to load icons from resources directory
             resources_dir = Path(__file__).parent.parent.parent / "resources" / "icons"
             if resources_dir.exists():
-                self.icons = {
-                    ApplicationState.IDLE: Image.open(resources_dir / "icon_idle.png"),
-                    ApplicationState.RECORDING: Image.open(resources_dir / "icon_recording.png"),
-                    ApplicationState.PROCESSING: Image.open(resources_dir / "icon_processing.png"),
-                    ApplicationState.ERROR: Image.open(resources_dir / "icon_error.png"),
-                    ApplicationState.CONFIGURING: Image.open(resources_dir / "icon_configuring.png")
+                icons = {
+                    ApplicationState.IDLE: _read_icon(resources_dir / "icon_idle.png"),
+                    ApplicationState.RECORDING: _read_icon(resources_dir / "icon_recording.png"),
+                    ApplicationState.PROCESSING: _read_icon(resources_dir / "icon_processing.png"),
+                    ApplicationState.ERROR: _read_icon(resources_dir / "icon_error.png"),
+                    ApplicationState.CONFIGURING: _read_icon(resources_dir / "icon_configuring.png")
                 }
                 self.logger.info("Loaded system tray icons from resources")
+                return icons
             else:
                 # Create default icons if resources don't exist
-                self._create_default_icons()
+                icons = self._create_default_icons()
                 self.logger.info("Created default system tray icons")
+                return icons
         except Exception as e:
             self.logger.warning(f"Failed to load icons: {e}. Creating default icons.")
-            self._create_default_icons()
+            return self._create_default_icons()
     
-    def _create_default_icons(self):
-        """Create default system tray icons using PIL."""
+    def _create_default_icons(self) -> Dict[ApplicationState, "Image.Image"]:
+        """Create default system tray icons using PIL, reusing earlier renders."""
         if not Image or not ImageDraw:
             self.logger.error("PIL not available, cannot create icons")
-            return
-        
-        # Create 32x32 icons with different colors
-        icon_size = (32, 32)
+            return {}
         
-        # Idle icon (gray)
-        idle_img = Image.new('RGBA', icon_size, (128, 128, 128, 255))
-        draw = ImageDraw.Draw(idle_img)
-        draw.ellipse([8, 8, 24, 24], fill=(200, 200, 200, 255))
-        self.icons[ApplicationState.IDLE] = idle_img
-        
-        # Recording icon (red)
-        recording_img = Image.new('RGBA', icon_size, (255, 0, 0, 255))
-        draw = ImageDraw.Draw(recording_img)
-        draw.ellipse([8, 8, 24, 24], fill=(255, 100, 100, 255))
-        self.icons[ApplicationState.RECORDING] = recording_img
+        icons = {}
+        cache_dir = _default_icon_cache_dir()
+        try:
+            for state, _, _ in DEFAULT_ICON_SPEC:
+                icons[state] = _read_icon(cache_dir / f"{state.value}.png")
+            return icons
+        except OSError:
+            pass
         
-        # Processing icon (blue)
-        processing_img = Image.new('RGBA', icon_size, (0, 0, 255, 255))
-        draw = ImageDraw.Draw(processing_img)
-        draw.ellipse([8, 8, 24, 24], fill=(100, 100, 255, 255))
-        self.icons[ApplicationState.PROCESSING] = processing_img
+        # Create 32x32 icons with different colors
+        for state, background, dot in DEFAULT_ICON_SPEC:
+            image = Image.new('RGBA', DEFAULT_ICON_SIZE, background)
+            ImageDraw.Draw(image).ellipse(DEFAULT_ICON_DOT_BOUNDS, fill=dot)
+            icons[state] = image
         
-        # Error icon (orange)
-        error_img = Image.new('RGBA', icon_size, (255, 165, 0, 255))
-        draw = ImageDraw.Draw(error_img)
-        draw.ellipse([8, 8, 24, 24], fill=(255, 200, 100, 255))
-        self.icons[ApplicationState.ERROR] = error_img
+        # Cache the renders for the next start; write-then-rename so a
+        # concurrent start never reads a partial file
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for state, _, _ in DEFAULT_ICON_SPEC:
+                path = cache_dir / f"{state.value}.png"
+                temp_path = cache_dir / f"{state.value}.{os.getpid()}.tmp"
+                icons[state].save(temp_path, 'PNG')
+                os.replace(temp_path, path)
+        except OSError as e:
+            self.logger.debug(f"Failed to cache default icons: {e}")
         
-        # Configuring icon (yellow)
-        configuring_img = Image.new('RGBA', icon_size, (255, 255, 0, 255))
-        draw = ImageDraw.Draw(configuring_img)
-        draw.ellipse([8, 8, 24, 24], fill=(255, 255, 100, 255))
-        self.icons[ApplicationState.CONFIGURING] = configuring_img
+        return icons
     
     def setup(self):
         """Setup the system tray icon and menu."""
-        if not PYSYSTRAY_AVAILABLE:
+        if not _load_tray_modules():
             self.logger.error("pystray not available, system tray disabled")
             return False
         
@@ -155,6 +355,9 @@ class SystemTrayApp:
                 menu
             )
             
+            self._updater_thread = threading.Thread(target=self._apply_state_updates, daemon=True)
+            self._updater_thread.start()
+            
             self.logger.info("System tray setup completed")
             return True
             
@@ -164,8 +367,15 @@ class SystemTrayApp:
     
     def _create_menu(self):
         """Create the system tray menu."""
+        # pystray menu items can't be modified once created, but callable
+        # text is re-read whenever the menu is rebuilt
+        self._status_menu_item = MenuItem(
+            lambda item: f"Status: {self.current_state.value.title()}",
+            None,
+            enabled=False
+        )
         return Menu(
-            MenuItem("Status", self._status_item, enabled=False),
+            self._status_menu_item,
             MenuItem("Toggle Recording", self._toggle_recording),
             MenuItem("Analytics Dashboard", self._show_analytics),
             MenuItem("Settings", self._open_settings),
@@ -186,26 +396,74 @@ class SystemTrayApp:
     
     def update_state(self, state: ApplicationState):
         """Update the system tray icon based on application state."""
-        if not self.icon or state not in self.icons:
+        if not self.icon or state not in self._state_display:
             return
         
-        try:
-            self.current_state = state
-            self.icon.icon = self.icons[state]
-            self.icon.title = f"Voice Dictation Assistant - {state.value.title()}"
+        # The state is current straight away; only redrawing the icon, title
+        # and menu is left to the updater thread
+        self.current_state = state
+        self._state_updates.put(state)
+    
+    def _apply_state_updates(self):
+        """Apply queued state changes to the icon in the updater thread."""
+        while True:
+            state = self._state_updates.get()
             
-            # Update menu status item
-            if hasattr(self, '_status_item'):
-                self._status_item.text = f"Status: {state.value.title()}"
+            # Only the newest of a burst of queued states needs to be shown
+            while state is not None:
+                try:
+                    state = self._state_updates.get_nowait()
+                except queue.Empty:
+                    break
+            if state is None:
+                break
             
-        except Exception as e:
-            self.logger.error(f"Failed to update system tray state: {e}")
+            try:
+                self.icon.icon, self.icon.title = self._state_display[state]
+                
+                # Refresh the status item's text
+                self.icon.update_menu()
+                
+            except Exception as e:
+                self.logger.error(f"Failed to update system tray state: {e}")
     
     def show_notification(self, title: str, message: str, duration: int = 3):
-        """Show a system notification."""
+        """
+        Show a system notification.
+        
+        Notifications raised in quick succession (e.g. while the state flips
+        between error and idle) are combined into a single toast shown
+        NOTIFICATION_COALESCE_SECONDS after the first of them.
+        """
         if not self.notifier:
             return
         
+        with self._notification_lock:
+            self._pending_notifications.append((title, message, duration))
+            if self._notification_timer is None:
+                self._notification_timer = threading.Timer(
+                    NOTIFICATION_COALESCE_SECONDS, self._flush_notifications
+                )
+                self._notification_timer.daemon = True
+                self._notification_timer.start()
+    
+    def _flush_notifications(self):
+        """Show the pending notifications as one toast."""
+        with self._notification_lock:
+            pending = self._pending_notifications
+            self._pending_notifications = []
+            self._notification_timer = None
+        
+        if not pending:
+            return
+        
+        if len(pending) == 1:
+            title, message, duration = pending[0]
+        else:
+            title = f"Voice Dictation Assistant ({len(pending)} events)"
+            message = "\n".join(message for _, message, _ in pending)
+            duration = max(duration for _, _, duration in pending)
+        
         try:
             self.notifier.show_toast(
                 title,
@@ -242,10 +500,6 @@ class SystemTrayApp:
             duration=5
         )
     
-    def _status_item(self, icon, item):
-        """Status menu item (read-only)."""
-        pass
-    
     def _toggle_recording(self, icon, item):
         """Toggle recording state."""
         try:
@@ -273,25 +527,9 @@ class SystemTrayApp:
     def _show_about(self, icon, item):
         """Show about dialog."""
         try:
-            about_text = """
-Voice Dictation Assistant
-Version 1.0.0
-
-A powerful voice dictation tool that uses AI to enhance your speech-to-text experience.
-
-Features:
-• Real-time speech recognition
-• AI-powered text enhancement
-• Context-aware formatting
-• Performance monitoring and analytics
-• Privacy-focused design
-
-For support and updates, visit the project repository.
-            """
-            
             self.show_notification(
                 "About Voice Dictation Assistant",
-                about_text.strip(),
+                ABOUT_TEXT,
                 duration=10
             )
             
@@ -308,6 +546,17 @@ For support and updates, visit the project repository.
     
     def stop(self):
         """Stop the system tray application."""
+        with self._notification_lock:
+            if self._notification_timer:
+                self._notification_timer.cancel()
+                self._notification_timer = None
+            self._pending_notifications = []
+        
+        if self._updater_thread:
+            self._state_updates.put(None)
+            self._updater_thread.join(timeout=1.0)
+            self._updater_thread = None
+        
         if self.icon:
             try:
                 self.icon.stop()
@@ -323,7 +572,8 @@ For support and updates, visit the project repository.
 def create_system_tray_app(toggle_recording_callback: Callable,
                           show_analytics_callback: Callable,
                           show_config_callback: Callable,
-                          shutdown_callback: Callable) -> Optional[SystemTrayApp]:
+                          shutdown_callback: Callable,
+                          toast_app_id: Optional[str] = None) -> Optional[SystemTrayApp]:
     """
     Create a system tray application.
     
@@ -332,11 +582,12 @@ def create_system_tray_app(toggle_recording_callback: Callable,
         show_analytics_callback: Callback for showing analytics dashboard
         show_config_callback: Callback for showing configuration
         shutdown_callback: Callback for shutting down the application
+        toast_app_id: Registered AppUserModelID for native WinRT toasts
     
     Returns:
         SystemTrayApp instance or None if not available
     """
-    if not PYSYSTRAY_AVAILABLE:
+    if not is_pystray_available():
         logging.getLogger(__name__).warning("pystray not available, system tray disabled")
         return None
     
@@ -345,7 +596,8 @@ def create_system_tray_app(toggle_recording_callback: Callable,
             toggle_recording_callback,
             show_analytics_callback,
             show_config_callback,
-            shutdown_callback
+            shutdown_callback,
+            toast_app_id
         )
         
         if app.setup():
@@ -28,7 +28,7 @@ class WorkflowStep(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowMetrics:
     """Metrics for tracking workflow performance."""
     recording_start_time: Optional[float] = None
@@ -8,9 +8,11 @@ other applications, and offering fallback solutions.
 
 import logging
 import subprocess
+from itertools import islice
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 # ``winreg`` is only available on Windows.  The conflict detector mainly uses
 # predefined dictionaries and does not rely on the module directly, so we import
@@ -21,23 +23,210 @@ except Exception:  # pragma: no cover
     winreg = None  # type: ignore
 
 
-class ConflictLevel(Enum):
-    """Enumeration for conflict severity levels."""
-    NONE = "none"
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+# Distinct hotkey strings whose conflict results are remembered per detector
+CONFLICT_CACHE_SIZE = 256
 
+# Distinct raw hotkey strings whose normalized form is remembered
+NORMALIZE_CACHE_SIZE = 512
 
-@dataclass
+# Maximum number of alternatives offered for a conflicting hotkey
+MAX_ALTERNATIVES = 5
+
+
+class ConflictLevel(IntEnum):
+    """Enumeration for conflict severity levels, ordered by severity."""
+    NONE = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+
+# validate_hotkey verdicts indexed by ConflictLevel: (is_valid, message prefix),
+# where a None prefix means the message is fixed
+_VALIDATION_RESULTS = (
+    (True, None),
+    (True, "Warning"),
+    (False, "Conflict detected"),
+    (False, "Critical conflict"),
+    (False, "Critical conflict"),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ConflictInfo:
     """Information about a detected conflict."""
     hotkey: str
     conflict_type: str
     description: str
     level: ConflictLevel
-    suggested_alternatives: List[str] = None
+    suggested_alternatives: Tuple[str, ...] = ()
+
+
+# Common Windows system shortcuts that should be avoided
+SYSTEM_SHORTCUTS = {
+    'ctrl+alt+delete': 'System Security',
+    'ctrl+shift+esc': 'Task Manager',
+    'win+r': 'Run Dialog',
+    'win+e': 'File Explorer',
+    'win+d': 'Show Desktop',
+    'win+l': 'Lock Computer',
+    'win+tab': 'Task View',
+    'alt+tab': 'Switch Windows',
+    'ctrl+alt+tab': 'Switch Windows (Extended)',
+    'win+space': 'Switch Input Language',
+    'win+shift+s': 'Snipping Tool',
+    'win+v': 'Clipboard History',
+    'win+period': 'Emoji Panel',
+    'win+shift+c': 'Cortana',
+    'win+a': 'Action Center',
+    'win+i': 'Settings',
+    'win+x': 'Power User Menu',
+    'win+u': 'Ease of Access',
+    'win+p': 'Project',
+    'win+k': 'Connect',
+    'win+comma': 'Peek at Desktop',
+    'win+home': 'Minimize All',
+    'win+shift+m': 'Restore All',
+    'win+shift+arrow': 'Move Window',
+    'win+arrow': 'Snap Window',
+    'ctrl+win+arrow': 'Move Virtual Desktop',
+    'win+ctrl+d': 'New Virtual Desktop',
+    'win+ctrl+f4': 'Close Virtual Desktop',
+    'win+ctrl+shift+arrow': 'Move Window to Virtual Desktop'
+}
+
+# Common application shortcuts that might conflict
+APPLICATION_SHORTCUTS = {
+    'ctrl+c': 'Copy',
+    'ctrl+v': 'Paste',
+    'ctrl+x': 'Cut',
+    'ctrl+z': 'Undo',
+    'ctrl+y': 'Redo',
+    'ctrl+a': 'Select All',
+    'ctrl+f': 'Find',
+    'ctrl+s': 'Save',
+    'ctrl+o': 'Open',
+    'ctrl+n': 'New',
+    'ctrl+p': 'Print',
+    'ctrl+w': 'Close',
+    'ctrl+q': 'Quit',
+    'ctrl+t': 'New Tab',
+    'ctrl+shift+t': 'Reopen Tab',
+    'ctrl+tab': 'Next Tab',
+    'ctrl+shift+tab': 'Previous Tab',
+    'f5': 'Refresh',
+    'f11': 'Full Screen',
+    'alt+f4': 'Close Window',
+    'alt+enter': 'Properties',
+    'shift+delete': 'Delete Permanently'
+}
+
+# Fallback hotkey suggestions
+FALLBACK_SUGGESTIONS = (
+    'ctrl+win+space',
+    'ctrl+win+r',
+    'ctrl+win+v',
+    'ctrl+win+x',
+    'ctrl+win+z',
+    'ctrl+win+c',
+    'ctrl+win+f',
+    'ctrl+win+g',
+    'ctrl+win+h',
+    'ctrl+win+j',
+    'ctrl+win+k',
+    'ctrl+win+l',
+    'ctrl+win+m',
+    'ctrl+win+n',
+    'ctrl+win+o',
+    'ctrl+win+p',
+    'ctrl+win+q',
+    'ctrl+win+s',
+    'ctrl+win+t',
+    'ctrl+win+u',
+    'ctrl+win+w',
+    'ctrl+win+y',
+    'alt+win+space',
+    'shift+win+space',
+    'ctrl+alt+space',
+    'ctrl+shift+space'
+)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_hotkey(hotkey: str) -> str:
+    """
+    Normalize a hotkey string for consistent comparison.
+    
+    Args:
+        hotkey: Raw hotkey string
+    
+    Returns:
+        str: Normalized hotkey string
+    """
+    # Lowercase, trim each part and sort them for consistent comparison
+    return '+'.join(sorted(part.strip() for part in hotkey.lower().split('+')))
+
+
+# The tables above are authored for readability; lookups go through copies
+# keyed by the normalized form that check_conflict produces
+_SYSTEM_LOOKUP = {
+    _normalize_hotkey(shortcut): description
+    for shortcut, description in SYSTEM_SHORTCUTS.items()
+}
+_APPLICATION_LOOKUP = {
+    _normalize_hotkey(shortcut): description
+    for shortcut, description in APPLICATION_SHORTCUTS.items()
+}
+_SYSTEM_PARTS = tuple(
+    (frozenset(shortcut.split('+')), shortcut, description)
+    for shortcut, description in SYSTEM_SHORTCUTS.items()
+)
+
+
+def _index_parts(entries) -> Dict[str, Tuple[int, ...]]:
+    """Map each key name to the positions of the entries containing it."""
+    index: Dict[str, List[int]] = {}
+    for position, (parts, _, _) in enumerate(entries):
+        for part in parts:
+            index.setdefault(part, []).append(position)
+    return {part: tuple(positions) for part, positions in index.items()}
+
+
+# Positions in _SYSTEM_PARTS of the shortcuts containing each key, so a partial
+# check only visits shortcuts sharing at least one key
+_SYSTEM_TOKEN_INDEX = _index_parts(_SYSTEM_PARTS)
+
+_FALLBACK_PARTS = tuple(
+    (suggestion, frozenset(suggestion.split('+'))) for suggestion in FALLBACK_SUGGESTIONS
+)
+
+
+def _find_partial_conflict(hotkey_parts: frozenset) -> Optional[Tuple[str, str]]:
+    """Return the first system shortcut overlapping significantly with the parts."""
+    candidates = set()
+    for part in hotkey_parts:
+        candidates.update(_SYSTEM_TOKEN_INDEX.get(part, ()))
+    
+    # Visit candidates in table order so the first match is reported
+    for position in sorted(candidates):
+        existing_parts, existing_hotkey, description = _SYSTEM_PARTS[position]
+        
+        # Check if there's significant overlap
+        overlap = hotkey_parts & existing_parts
+        if len(overlap) >= 2 and len(hotkey_parts) <= len(existing_parts):
+            return existing_hotkey, description
+    
+    return None
+
+
+def _is_conflict_free(normalized_hotkey: str) -> bool:
+    """Check a normalized hotkey without building a ConflictInfo."""
+    return (
+        normalized_hotkey not in _SYSTEM_LOOKUP
+        and normalized_hotkey not in _APPLICATION_LOOKUP
+        and _find_partial_conflict(frozenset(normalized_hotkey.split('+'))) is None
+    )
 
 
 class HotkeyConflictDetector:
@@ -48,98 +237,18 @@ class HotkeyConflictDetector:
     and provides fallback suggestions for conflicting combinations.
     """
     
+    system_shortcuts = SYSTEM_SHORTCUTS
+    application_shortcuts = APPLICATION_SHORTCUTS
+    fallback_suggestions = FALLBACK_SUGGESTIONS
+    
+    _normalize_hotkey = staticmethod(_normalize_hotkey)
+    
     def __init__(self):
         """Initialize the conflict detector."""
         self.logger = logging.getLogger(__name__)
         
-        # Common Windows system shortcuts that should be avoided
-        self.system_shortcuts = {
-            'ctrl+alt+delete': 'System Security',
-            'ctrl+shift+esc': 'Task Manager',
-            'win+r': 'Run Dialog',
-            'win+e': 'File Explorer',
-            'win+d': 'Show Desktop',
-            'win+l': 'Lock Computer',
-            'win+tab': 'Task View',
-            'alt+tab': 'Switch Windows',
-            'ctrl+alt+tab': 'Switch Windows (Extended)',
-            'win+space': 'Switch Input Language',
-            'win+shift+s': 'Snipping Tool',
-            'win+v': 'Clipboard History',
-            'win+period': 'Emoji Panel',
-            'win+shift+c': 'Cortana',
-            'win+a': 'Action Center',
-            'win+i': 'Settings',
-            'win+x': 'Power User Menu',
-            'win+u': 'Ease of Access',
-            'win+p': 'Project',
-            'win+k': 'Connect',
-            'win+comma': 'Peek at Desktop',
-            'win+home': 'Minimize All',
-            'win+shift+m': 'Restore All',
-            'win+shift+arrow': 'Move Window',
-            'win+arrow': 'Snap Window',
-            'ctrl+win+arrow': 'Move Virtual Desktop',
-            'win+ctrl+d': 'New Virtual Desktop',
-            'win+ctrl+f4': 'Close Virtual Desktop',
-            'win+ctrl+shift+arrow': 'Move Window to Virtual Desktop'
-        }
-        
-        # Common application shortcuts that might conflict
-        self.application_shortcuts = {
-            'ctrl+c': 'Copy',
-            'ctrl+v': 'Paste',
-            'ctrl+x': 'Cut',
-            'ctrl+z': 'Undo',
-            'ctrl+y': 'Redo',
-            'ctrl+a': 'Select All',
-            'ctrl+f': 'Find',
-            'ctrl+s': 'Save',
-            'ctrl+o': 'Open',
-            'ctrl+n': 'New',
-            'ctrl+p': 'Print',
-            'ctrl+w': 'Close',
-            'ctrl+q': 'Quit',
-            'ctrl+t': 'New Tab',
-            'ctrl+shift+t': 'Reopen Tab',
-            'ctrl+tab': 'Next Tab',
-            'ctrl+shift+tab': 'Previous Tab',
-            'f5': 'Refresh',
-            'f11': 'Full Screen',
-            'alt+f4': 'Close Window',
-            'alt+enter': 'Properties',
-            'shift+delete': 'Delete Permanently'
-        }
-        
-        # Fallback hotkey suggestions
-        self.fallback_suggestions = [
-            'ctrl+win+space',
-            'ctrl+win+r',
-            'ctrl+win+v',
-            'ctrl+win+x',
-            'ctrl+win+z',
-            'ctrl+win+c',
-            'ctrl+win+f',
-            'ctrl+win+g',
-            'ctrl+win+h',
-            'ctrl+win+j',
-            'ctrl+win+k',
-            'ctrl+win+l',
-            'ctrl+win+m',
-            'ctrl+win+n',
-            'ctrl+win+o',
-            'ctrl+win+p',
-            'ctrl+win+q',
-            'ctrl+win+s',
-            'ctrl+win+t',
-            'ctrl+win+u',
-            'ctrl+win+w',
-            'ctrl+win+y',
-            'alt+win+space',
-            'shift+win+space',
-            'ctrl+alt+space',
-            'ctrl+shift+space'
-        ]
+        # Results depend only on the input and the fixed module tables
+        self._check_conflict_cached = lru_cache(maxsize=CONFLICT_CACHE_SIZE)(self._check_conflict)
     
     def check_conflict(self, hotkey: str) -> ConflictInfo:
         """
@@ -151,24 +260,30 @@ class HotkeyConflictDetector:
         Returns:
             ConflictInfo: Information about any detected conflicts
         """
+        return self._check_conflict_cached(hotkey)
+    
+    def _check_conflict(self, hotkey: str) -> ConflictInfo:
+        """Uncached implementation of check_conflict."""
         normalized_hotkey = self._normalize_hotkey(hotkey)
         
         # Check system shortcuts
-        if normalized_hotkey in self.system_shortcuts:
+        system_description = _SYSTEM_LOOKUP.get(normalized_hotkey)
+        if system_description is not None:
             return ConflictInfo(
                 hotkey=hotkey,
                 conflict_type="system_shortcut",
-                description=f"Conflicts with Windows system shortcut: {self.system_shortcuts[normalized_hotkey]}",
+                description=f"Conflicts with Windows system shortcut: {system_description}",
                 level=ConflictLevel.HIGH,
                 suggested_alternatives=self._get_alternatives(hotkey)
             )
         
         # Check application shortcuts
-        if normalized_hotkey in self.application_shortcuts:
+        application_description = _APPLICATION_LOOKUP.get(normalized_hotkey)
+        if application_description is not None:
             return ConflictInfo(
                 hotkey=hotkey,
                 conflict_type="application_shortcut",
-                description=f"Conflicts with common application shortcut: {self.application_shortcuts[normalized_hotkey]}",
+                description=f"Conflicts with common application shortcut: {application_description}",
                 level=ConflictLevel.MEDIUM,
                 suggested_alternatives=self._get_alternatives(hotkey)
             )
@@ -184,7 +299,7 @@ class HotkeyConflictDetector:
             conflict_type="none",
             description="No conflicts detected",
             level=ConflictLevel.NONE,
-            suggested_alternatives=[]
+            suggested_alternatives=()
         )
     
     def _check_partial_conflicts(self, hotkey: str) -> Optional[ConflictInfo]:
@@ -197,25 +312,20 @@ class HotkeyConflictDetector:
         Returns:
             ConflictInfo: Information about partial conflicts, or None if none found
         """
-        hotkey_parts = set(hotkey.split('+'))
-        
-        for existing_hotkey, description in self.system_shortcuts.items():
-            existing_parts = set(existing_hotkey.split('+'))
-            
-            # Check if there's significant overlap
-            overlap = hotkey_parts.intersection(existing_parts)
-            if len(overlap) >= 2 and len(hotkey_parts) <= len(existing_parts):
-                return ConflictInfo(
-                    hotkey=hotkey,
-                    conflict_type="partial_system_conflict",
-                    description=f"Partially conflicts with system shortcut: {description} ({existing_hotkey})",
-                    level=ConflictLevel.LOW,
-                    suggested_alternatives=self._get_alternatives(hotkey)
-                )
+        partial = _find_partial_conflict(frozenset(hotkey.split('+')))
+        if partial is None:
+            return None
         
-        return None
+        existing_hotkey, description = partial
+        return ConflictInfo(
+            hotkey=hotkey,
+            conflict_type="partial_system_conflict",
+            description=f"Partially conflicts with system shortcut: {description} ({existing_hotkey})",
+            level=ConflictLevel.LOW,
+            suggested_alternatives=self._get_alternatives(hotkey)
+        )
     
-    def _get_alternatives(self, hotkey: str) -> List[str]:
+    def _get_alternatives(self, hotkey: str) -> Tuple[str, ...]:
         """
         Get alternative hotkey suggestions for a conflicting combination.
         
@@ -223,42 +333,16 @@ class HotkeyConflictDetector:
             hotkey: The conflicting hotkey combination
             
         Returns:
-            List[str]: List of alternative hotkey combinations
+            Tuple[str, ...]: Alternative hotkey combinations
         """
-        # Filter out the conflicting hotkey and similar ones
-        alternatives = []
-        conflicting_parts = set(hotkey.split('+'))
-        
-        for suggestion in self.fallback_suggestions:
-            suggestion_parts = set(suggestion.split('+'))
-            
-            # Avoid suggestions that are too similar to the conflicting hotkey
-            if len(conflicting_parts.intersection(suggestion_parts)) < 2:
-                alternatives.append(suggestion)
-            
-            if len(alternatives) >= 5:  # Limit to 5 suggestions
-                break
-        
-        return alternatives
-    
-    def _normalize_hotkey(self, hotkey: str) -> str:
-        """
-        Normalize a hotkey string for consistent comparison.
-        
-        Args:
-            hotkey: Raw hotkey string
-            
-        Returns:
-            str: Normalized hotkey string
-        """
-        # Convert to lowercase and remove extra spaces
-        normalized = hotkey.lower().strip()
-        
-        # Sort the parts for consistent comparison
-        parts = normalized.split('+')
-        parts.sort()
+        conflicting_parts = frozenset(hotkey.split('+'))
         
-        return '+'.join(parts)
+        # Avoid suggestions that are too similar to the conflicting hotkey
+        return tuple(islice(
+            (suggestion for suggestion, parts in _FALLBACK_PARTS
+             if len(conflicting_parts & parts) < 2),
+            MAX_ALTERNATIVES
+        ))
     
     def get_safe_hotkeys(self, count: int = 5) -> List[str]:
         """
@@ -272,9 +356,10 @@ class HotkeyConflictDetector:
         """
         safe_hotkeys = []
         
+        # Only the verdict matters here, so skip building conflict results
+        # (and their alternatives) for the unsafe suggestions
         for suggestion in self.fallback_suggestions:
-            conflict_info = self.check_conflict(suggestion)
-            if conflict_info.level == ConflictLevel.NONE:
+            if _is_conflict_free(_normalize_hotkey(suggestion)):
                 safe_hotkeys.append(suggestion)
             
             if len(safe_hotkeys) >= count:
@@ -294,14 +379,10 @@ class HotkeyConflictDetector:
         """
         conflict_info = self.check_conflict(hotkey)
         
-        if conflict_info.level == ConflictLevel.NONE:
-            return True, "Hotkey is safe to use"
-        elif conflict_info.level == ConflictLevel.LOW:
-            return True, f"Warning: {conflict_info.description}"
-        elif conflict_info.level == ConflictLevel.MEDIUM:
-            return False, f"Conflict detected: {conflict_info.description}"
-        else:  # HIGH or CRITICAL
-            return False, f"Critical conflict: {conflict_info.description}"
+        is_valid, prefix = _VALIDATION_RESULTS[conflict_info.level]
+        if prefix is None:
+            return is_valid, "Hotkey is safe to use"
+        return is_valid, f"{prefix}: {conflict_info.description}"
     
     def get_conflict_report(self, hotkeys: List[str]) -> Dict[str, ConflictInfo]:
         """
@@ -6,12 +6,38 @@ the base HotkeyManager with push-to-talk functionality for voice recording.
 """
 
 import logging
-from typing import Dict, Callable, Optional, List, Tuple
+import sys
+from dataclasses import dataclass, replace
+from typing import Dict, Callable, Optional, List, Tuple, TYPE_CHECKING
 from .hotkey_manager import HotkeyManager, HotkeyMode, HotkeyConfig
 from .push_to_talk import PushToTalkHandler, PushToTalkConfig, RecordingState
-from .conflict_detector import HotkeyConflictDetector, ConflictInfo, ConflictLevel
-from .feedback_system import HotkeyFeedbackSystem, FeedbackConfig, FeedbackType
-from .security_compatibility import WindowsSecurityCompatibility, SecurityLevel
+from .conflict_detector import HotkeyConflictDetector, ConflictInfo, ConflictLevel, _normalize_hotkey
+
+# feedback_system needs winsound and security_compatibility probes the Windows
+# security stack, so both are only imported once a manager first uses them
+if TYPE_CHECKING:
+    from .feedback_system import HotkeyFeedbackSystem, FeedbackType
+    from .security_compatibility import WindowsSecurityCompatibility
+
+
+# Conflict levels that block registration outright
+_BLOCKING_LEVELS = frozenset({ConflictLevel.HIGH, ConflictLevel.CRITICAL})
+
+
+def _canonical_hotkey(hotkey: str) -> str:
+    """Canonical, interned key for the push-to-talk handler table."""
+    # Same normalization as the conflict detector, so both agree on which
+    # spellings name the same hotkey
+    return sys.intern(_normalize_hotkey(hotkey))
+
+
+@dataclass(slots=True, frozen=True)
+class _RegistrationCheck:
+    """Outcome of the checks shared by the register methods."""
+    ok: bool
+    error: str = ""  # Failure reason when not ok
+    warning: str = ""  # Suffix for the success message when ok
+    conflict_info: Optional[ConflictInfo] = None
 
 
 class EnhancedHotkeyManager:
@@ -22,6 +48,12 @@ class EnhancedHotkeyManager:
     with proper event handling and state management.
     """
     
+    __slots__ = (
+        'config', '_pt_template', 'base_manager', 'push_to_talk_handlers',
+        '_conflict_detector', '_security_compatibility', '_feedback_system', 'logger',
+        'register_hotkey', 'unregister_hotkey', 'get_registered_hotkeys', 'is_hotkey_registered'
+    )
+    
     def __init__(self, config: Dict = None):
         """
         Initialize the EnhancedHotkeyManager.
@@ -30,17 +62,31 @@ class EnhancedHotkeyManager:
             config: Configuration dictionary containing hotkey settings
         """
         self.config = config or {}
-        self.base_manager = HotkeyManager(config)
-        self.push_to_talk_handlers: Dict[str, PushToTalkHandler] = {}
-        self.conflict_detector = HotkeyConflictDetector()
-        self.security_compatibility = WindowsSecurityCompatibility()
         
-        # Initialize feedback system
-        feedback_config = FeedbackConfig(
+        # Push-to-talk settings shared by every handler, resolved once. Handlers
+        # never modify their config, so callback-less handlers share this one.
+        self._pt_template = PushToTalkConfig(
+            min_hold_time=self.config.get('min_hold_time', 0.1),
+            max_hold_time=self.config.get('max_hold_time', 30.0),
             visual_feedback=self.config.get('visual_feedback', True),
             audio_feedback=self.config.get('audio_feedback', True)
         )
-        self.feedback_system = HotkeyFeedbackSystem(feedback_config)
+        
+        self.base_manager = HotkeyManager(config)
+        
+        # Delegate other methods to base manager (bound directly, no wrapper frame)
+        self.register_hotkey = self.base_manager.register_hotkey
+        self.unregister_hotkey = self.base_manager.unregister_hotkey
+        self.get_registered_hotkeys = self.base_manager.get_registered_hotkeys
+        self.is_hotkey_registered = self.base_manager.is_hotkey_registered
+        # Keyed by canonical hotkey, so spelling and modifier order don't matter
+        self.push_to_talk_handlers: Dict[str, PushToTalkHandler] = {}
+        
+        
+        # Created on first access, see the properties below
+        self._conflict_detector: Optional[HotkeyConflictDetector] = None
+        self._security_compatibility: Optional['WindowsSecurityCompatibility'] = None
+        self._feedback_system: Optional['HotkeyFeedbackSystem'] = None
         
         # Initialize logger
         self.logger = logging.getLogger(__name__)
@@ -48,6 +94,32 @@ class EnhancedHotkeyManager:
         # Set up push-to-talk handlers for default hotkeys
         self._setup_push_to_talk_handlers()
     
+    @property
+    def conflict_detector(self) -> HotkeyConflictDetector:
+        """Conflict detector, created on first use."""
+        if self._conflict_detector is None:
+            self._conflict_detector = HotkeyConflictDetector()
+        return self._conflict_detector
+    
+    @property
+    def security_compatibility(self) -> 'WindowsSecurityCompatibility':
+        """Windows security checks, imported and created on first use."""
+        if self._security_compatibility is None:
+            from .security_compatibility import WindowsSecurityCompatibility
+            self._security_compatibility = WindowsSecurityCompatibility()
+        return self._security_compatibility
+    
+    @property
+    def feedback_system(self) -> 'HotkeyFeedbackSystem':
+        """Hotkey feedback system, imported and created on first use."""
+        if self._feedback_system is None:
+            from .feedback_system import HotkeyFeedbackSystem, FeedbackConfig
+            self._feedback_system = HotkeyFeedbackSystem(FeedbackConfig(
+                visual_feedback=self._pt_template.visual_feedback,
+                audio_feedback=self._pt_template.audio_feedback
+            ))
+        return self._feedback_system
+    
     def _setup_push_to_talk_handlers(self):
         """Set up push-to-talk handlers for hotkeys that support it."""
         push_to_talk_hotkeys = [
@@ -65,24 +137,16 @@ class EnhancedHotkeyManager:
         Args:
             hotkey: The hotkey combination to create a handler for
         """
-        # Create push-to-talk configuration
-        pt_config = PushToTalkConfig(
-            min_hold_time=self.config.get('min_hold_time', 0.1),
-            max_hold_time=self.config.get('max_hold_time', 30.0),
-            visual_feedback=self.config.get('visual_feedback', True),
-            audio_feedback=self.config.get('audio_feedback', True)
-        )
-        
-        # Create the handler
-        pt_handler = PushToTalkHandler(pt_config)
+        # Create the handler with the shared push-to-talk configuration
+        pt_handler = PushToTalkHandler(self._pt_template)
         
         # Register callbacks for key events
         self._register_push_to_talk_callbacks(hotkey, pt_handler)
         
         # Store the handler
-        self.push_to_talk_handlers[hotkey] = pt_handler
+        self.push_to_talk_handlers[_canonical_hotkey(hotkey)] = pt_handler
         
-        self.logger.info(f"Created push-to-talk handler for hotkey: {hotkey}")
+        self.logger.info("Created push-to-talk handler for hotkey: %s", hotkey)
     
     def _register_push_to_talk_callbacks(self, hotkey: str, pt_handler: PushToTalkHandler):
         """
@@ -96,37 +160,46 @@ class EnhancedHotkeyManager:
         # We'll need to implement this using a different approach or modify the base manager
         # For now, we'll use the toggle approach and simulate push-to-talk behavior
         
+        # Bind everything the callback needs up front; it runs on every press.
+        # Feedback goes through the manager so the feedback system is only
+        # loaded on the first press, not when the hotkey is registered.
+        provide_feedback = self.provide_feedback
+        idle = RecordingState.IDLE
+        recording = RecordingState.RECORDING
+        key_down = pt_handler.on_key_down
+        key_up = pt_handler.on_key_up
+        
         def toggle_callback():
             """Toggle callback that simulates push-to-talk behavior."""
-            current_state = pt_handler.get_current_state()
+            # The handler's own state decides the action, since it can also
+            # start late (minimum hold) or stop by itself (auto-stop)
+            current_state = pt_handler.state
             
-            if current_state == RecordingState.IDLE:
+            if current_state is idle:
                 # Provide feedback for recording start
-                self.feedback_system.provide_feedback('recording_start', FeedbackType.BOTH)
-                pt_handler.on_key_down()
-            elif current_state == RecordingState.RECORDING:
+                provide_feedback('recording_start')
+                key_down()
+            elif current_state is recording:
                 # Provide feedback for recording stop
-                self.feedback_system.provide_feedback('recording_stop', FeedbackType.BOTH)
-                pt_handler.on_key_up()
+                provide_feedback('recording_stop')
+                key_up()
         
         # Register the callback with the base manager
         self.base_manager.register_callback(hotkey, toggle_callback, "Push-to-Talk Recording")
     
-    def register_push_to_talk_hotkey(self, hotkey: str, start_callback: Callable = None, 
-                                   stop_callback: Callable = None) -> Tuple[bool, str]:
+    def _precheck(self, hotkey: str, require_security: bool) -> _RegistrationCheck:
         """
-        Register a new push-to-talk hotkey with conflict detection and security checks.
+        Run the security and conflict checks shared by the register methods.
         
         Args:
             hotkey: The hotkey combination
-            start_callback: Callback to call when recording starts
-            stop_callback: Callback to call when recording stops
+            require_security: Whether global hotkey permissions must be checked
             
         Returns:
-            Tuple[bool, str]: (success, message) - success status and feedback message
+            _RegistrationCheck: Whether registration may proceed, with the
+            failure reason or the warning suffix for the success message
         """
-        try:
-            # Check security permissions first
+        if require_security:
             has_perms, security_info = self.security_compatibility.check_operation_permissions(
                 'global_hotkey_registration'
             )
@@ -136,20 +209,42 @@ class EnhancedHotkeyManager:
                 mitigation = self.security_compatibility.get_mitigation_strategies('global_hotkey_registration')
                 if mitigation:
                     message += f"\nMitigation: {mitigation[0]}"
-                return False, message
-            
-            # Check for conflicts
-            conflict_info = self.conflict_detector.check_conflict(hotkey)
-            
-            if conflict_info.level in [ConflictLevel.HIGH, ConflictLevel.CRITICAL]:
-                message = f"Registration failed: {conflict_info.description}"
-                if conflict_info.suggested_alternatives:
-                    message += f"\nSuggested alternatives: {', '.join(conflict_info.suggested_alternatives[:3])}"
-                return False, message
+                return _RegistrationCheck(False, error=message)
+        
+        conflict_info = self.conflict_detector.check_conflict(hotkey)
+        
+        if conflict_info.level in _BLOCKING_LEVELS:
+            message = f"Registration failed: {conflict_info.description}"
+            if conflict_info.suggested_alternatives:
+                message += f"\nSuggested alternatives: {', '.join(conflict_info.suggested_alternatives[:3])}"
+            return _RegistrationCheck(False, error=message, conflict_info=conflict_info)
+        
+        # Warn about medium-level conflicts but allow registration
+        if conflict_info.level == ConflictLevel.MEDIUM:
+            self.logger.warning("Registering hotkey with medium conflict: %s", conflict_info.description)
+        
+        warning = ""
+        if conflict_info.level == ConflictLevel.LOW:
+            warning = f" (Warning: {conflict_info.description})"
+        return _RegistrationCheck(True, warning=warning, conflict_info=conflict_info)
+    
+    def register_push_to_talk_hotkey(self, hotkey: str, start_callback: Callable = None, 
+                                   stop_callback: Callable = None) -> Tuple[bool, str]:
+        """
+        Register a new push-to-talk hotkey with conflict detection and security checks.
+        
+        Args:
+            hotkey: The hotkey combination
+            start_callback: Callback to call when recording starts
+            stop_callback: Callback to call when recording stops
             
-            # Warn about medium-level conflicts but allow registration
-            if conflict_info.level == ConflictLevel.MEDIUM:
-                self.logger.warning(f"Registering hotkey with medium conflict: {conflict_info.description}")
+        Returns:
+            Tuple[bool, str]: (success, message) - success status and feedback message
+        """
+        try:
+            check = self._precheck(hotkey, require_security=True)
+            if not check.ok:
+                return False, check.error
             
             # Create hotkey config
             hotkey_config = HotkeyConfig(
@@ -163,25 +258,19 @@ class EnhancedHotkeyManager:
                 return False, "Failed to register hotkey with system"
             
             # Create push-to-talk handler
-            pt_config = PushToTalkConfig(
+            pt_config = replace(
+                self._pt_template,
                 start_callback=start_callback,
-                stop_callback=stop_callback,
-                min_hold_time=self.config.get('min_hold_time', 0.1),
-                max_hold_time=self.config.get('max_hold_time', 30.0),
-                visual_feedback=self.config.get('visual_feedback', True),
-                audio_feedback=self.config.get('audio_feedback', True)
+                stop_callback=stop_callback
             )
             
             pt_handler = PushToTalkHandler(pt_config)
-            self.push_to_talk_handlers[hotkey] = pt_handler
+            self.push_to_talk_handlers[_canonical_hotkey(hotkey)] = pt_handler
             
             # Register callbacks
             self._register_push_to_talk_callbacks(hotkey, pt_handler)
             
-            success_message = f"Successfully registered push-to-talk hotkey: {hotkey}"
-            if conflict_info.level == ConflictLevel.LOW:
-                success_message += f" (Warning: {conflict_info.description})"
-            
+            success_message = f"Successfully registered push-to-talk hotkey: {hotkey}{check.warning}"
             self.logger.info(success_message)
             return True, success_message
             
@@ -203,18 +292,9 @@ class EnhancedHotkeyManager:
             Tuple[bool, str]: (success, message) - success status and feedback message
         """
         try:
-            # Check for conflicts first
-            conflict_info = self.conflict_detector.check_conflict(hotkey)
-            
-            if conflict_info.level in [ConflictLevel.HIGH, ConflictLevel.CRITICAL]:
-                message = f"Registration failed: {conflict_info.description}"
-                if conflict_info.suggested_alternatives:
-                    message += f"\nSuggested alternatives: {', '.join(conflict_info.suggested_alternatives[:3])}"
-                return False, message
-            
-            # Warn about medium-level conflicts but allow registration
-            if conflict_info.level == ConflictLevel.MEDIUM:
-                self.logger.warning(f"Registering hotkey with medium conflict: {conflict_info.description}")
+            check = self._precheck(hotkey, require_security=False)
+            if not check.ok:
+                return False, check.error
             
             # Create hotkey config
             hotkey_config = HotkeyConfig(
@@ -225,18 +305,13 @@ class EnhancedHotkeyManager:
             )
             
             # Register with base manager
-            success = self.base_manager.register_hotkey(hotkey_config)
-            
-            if success:
-                success_message = f"Successfully registered toggle hotkey: {hotkey}"
-                if conflict_info.level == ConflictLevel.LOW:
-                    success_message += f" (Warning: {conflict_info.description})"
-                
-                self.logger.info(success_message)
-                return True, success_message
-            else:
+            if not self.base_manager.register_hotkey(hotkey_config):
                 return False, "Failed to register hotkey with system"
             
+            success_message = f"Successfully registered toggle hotkey: {hotkey}{check.warning}"
+            self.logger.info(success_message)
+            return True, success_message
+            
         except Exception as e:
             error_message = f"Failed to register toggle hotkey {hotkey}: {e}"
             self.logger.error(error_message)
@@ -252,7 +327,7 @@ class EnhancedHotkeyManager:
         Returns:
             PushToTalkHandler: The handler for the hotkey, or None if not found
         """
-        return self.push_to_talk_handlers.get(hotkey)
+        return self.push_to_talk_handlers.get(_canonical_hotkey(hotkey))
     
     def is_recording(self, hotkey: str = None) -> bool:
         """
@@ -268,12 +343,9 @@ class EnhancedHotkeyManager:
             handler = self.get_push_to_talk_handler(hotkey)
             return handler.is_recording() if handler else False
         
-        # Check any push-to-talk handler
-        for handler in self.push_to_talk_handlers.values():
-            if handler.is_recording():
-                return True
-        
-        return False
+        # Check any push-to-talk handler; there are only ever a few, and
+        # their own state is the only reliable answer
+        return any(handler.is_recording() for handler in list(self.push_to_talk_handlers.values()))
     
     def force_stop_recording(self, hotkey: str = None):
         """
@@ -287,7 +359,9 @@ class EnhancedHotkeyManager:
             if handler:
                 handler.force_stop()
         else:
-            for handler in self.push_to_talk_handlers.values():
+            # Snapshot so a registration from another thread can't resize the dict
+            handlers = list(self.push_to_talk_handlers.values())
+            for handler in handlers:
                 handler.force_stop()
     
     def start_listening(self):
@@ -301,11 +375,13 @@ class EnhancedHotkeyManager:
     def cleanup(self):
         """Clean up all resources."""
         # Clean up push-to-talk handlers
-        for handler in self.push_to_talk_handlers.values():
+        handlers = list(self.push_to_talk_handlers.values())
+        for handler in handlers:
             handler.cleanup()
         
-        # Clean up feedback system
-        self.feedback_system.cleanup()
+        # Clean up feedback system, if it was ever created
+        if self._feedback_system is not None:
+            self._feedback_system.cleanup()
         
         # Clean up base manager
         self.base_manager.cleanup()
@@ -320,19 +396,6 @@ class EnhancedHotkeyManager:
         """Context manager exit."""
         self.cleanup()
     
-    # Delegate other methods to base manager
-    def register_hotkey(self, *args, **kwargs):
-        return self.base_manager.register_hotkey(*args, **kwargs)
-    
-    def unregister_hotkey(self, *args, **kwargs):
-        return self.base_manager.unregister_hotkey(*args, **kwargs)
-    
-    def get_registered_hotkeys(self, *args, **kwargs):
-        return self.base_manager.get_registered_hotkeys(*args, **kwargs)
-    
-    def is_hotkey_registered(self, *args, **kwargs):
-        return self.base_manager.is_hotkey_registered(*args, **kwargs)
-    
     def check_hotkey_conflicts(self, hotkeys: List[str]) -> Dict[str, ConflictInfo]:
         """
         Check for conflicts in a list of hotkeys.
@@ -369,7 +432,7 @@ class EnhancedHotkeyManager:
         """
         return self.conflict_detector.validate_hotkey(hotkey)
     
-    def get_feedback_system(self) -> HotkeyFeedbackSystem:
+    def get_feedback_system(self) -> 'HotkeyFeedbackSystem':
         """
         Get the feedback system instance.
         
@@ -378,15 +441,18 @@ class EnhancedHotkeyManager:
         """
         return self.feedback_system
     
-    def provide_feedback(self, event_type: str, feedback_type: FeedbackType = FeedbackType.BOTH):
+    def provide_feedback(self, event_type: str, feedback_type: Optional['FeedbackType'] = None):
         """
         Provide feedback for a specific event.
         
         Args:
             event_type: Type of event
-            feedback_type: Type of feedback to provide
+            feedback_type: Type of feedback to provide (default: both)
         """
-        self.feedback_system.provide_feedback(event_type, feedback_type)
+        if feedback_type is None:
+            self.feedback_system.provide_feedback(event_type)
+        else:
+            self.feedback_system.provide_feedback(event_type, feedback_type)
     
     def set_system_tray_callback(self, callback: Callable):
         """
@@ -10,10 +10,15 @@ This module demonstrates how to use the EnhancedHotkeyManager with all its featu
 """
 
 import logging
+import signal
 import time
 from typing import Callable
 from .enhanced_hotkey_manager import EnhancedHotkeyManager
 from .feedback_system import FeedbackType
+from .conflict_detector import ConflictLevel
+
+# Sleep interval for the idle main thread where signal.pause() is unavailable
+IDLE_SLEEP_SECONDS = 3600
 
 
 def setup_logging():
@@ -149,7 +154,7 @@ def main():
     conflicts = hotkey_manager.check_hotkey_conflicts(hotkeys_to_check)
     
     for hotkey, conflict_info in conflicts.items():
-        if conflict_info.level.value != 'none':
+        if conflict_info.level != ConflictLevel.NONE:
             print(f"⚠️  {hotkey}: {conflict_info.description}")
         else:
             print(f"✅ {hotkey}: No conflicts")
@@ -187,13 +192,16 @@ def main():
     print("\nPress Ctrl+C to exit...")
     
     try:
-        # Keep the program running to test hotkeys
-        while True:
-            time.sleep(1)
-            
-            # Check if any hotkey is currently recording
-            if hotkey_manager.is_recording():
-                print("🎤 Currently recording...")
+        # Keep the program running to test hotkeys. The recording callbacks
+        # report start/stop as they happen, so the main thread just idles
+        # until Ctrl+C instead of polling is_recording().
+        if hasattr(signal, 'pause'):
+            signal.pause()
+        else:
+            # Windows has no signal.pause(); a long sleep is still interrupted
+            # by Ctrl+C
+            while True:
+                time.sleep(IDLE_SLEEP_SECONDS)
             
     except KeyboardInterrupt:
         print("\n⏹️ Stopping hotkey system...")
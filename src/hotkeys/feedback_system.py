@@ -6,13 +6,21 @@ recording states, and error conditions in the Voice Dictation Assistant.
 """
 
 import logging
+import queue
 import threading
 import time
 import winsound
+from functools import lru_cache
 from typing import Optional, Callable
 from enum import Enum
 from dataclasses import dataclass
 
+from utils.audio_tones import AUDIO_QUEUE_SIZE, synthesize_tone
+
+
+# Beeps are played from in-memory WAVs, cached per (frequency, duration)
+TONE_CACHE_SIZE = 64
+
 
 class FeedbackType(Enum):
     """Enumeration for feedback types."""
@@ -29,6 +37,12 @@ class FeedbackLevel(Enum):
     HIGH = "high"
 
 
+@lru_cache(maxsize=TONE_CACHE_SIZE)
+def _synthesize_tone(frequency: int, duration: int) -> bytes:
+    """Render a beep as an in-memory WAV file, once per frequency and duration."""
+    return synthesize_tone(frequency, duration)
+
+
 @dataclass
 class FeedbackConfig:
     """Configuration for feedback behavior."""
@@ -74,6 +88,10 @@ class HotkeyFeedbackSystem:
             'success': 250           # ms
         }
         
+        # Render the beeps up front so the first press doesn't pay for it
+        for event_type, frequency in self.audio_frequencies.items():
+            _synthesize_tone(frequency, self.audio_durations[event_type])
+        
         # Visual feedback states
         self.current_visual_state = "idle"
         self.visual_states = {
@@ -84,6 +102,12 @@ class HotkeyFeedbackSystem:
             'warning': {'icon': 'warning', 'color': 'orange'},
             'success': {'icon': 'success', 'color': 'green'}
         }
+        
+        # One worker plays every beep in order; started on the first beep.
+        # Playing from memory cannot be asynchronous, hence the worker.
+        self._audio_queue: queue.Queue = queue.Queue(maxsize=AUDIO_QUEUE_SIZE)
+        self._audio_thread: Optional[threading.Thread] = None
+        self._audio_lock = threading.Lock()
     
     def provide_feedback(self, event_type: str, feedback_type: FeedbackType = FeedbackType.BOTH):
         """
@@ -100,10 +124,10 @@ class HotkeyFeedbackSystem:
             if feedback_type in [FeedbackType.AUDIO, FeedbackType.BOTH]:
                 self._provide_audio_feedback(event_type)
             
-            self.logger.debug(f"Provided {feedback_type.value} feedback for event: {event_type}")
+            self.logger.debug("Provided %s feedback for event: %s", feedback_type.value, event_type)
             
         except Exception as e:
-            self.logger.error(f"Failed to provide feedback for {event_type}: {e}")
+            self.logger.error("Failed to provide feedback for %s: %s", event_type, e)
     
     def _provide_visual_feedback(self, event_type: str):
         """
@@ -141,41 +165,61 @@ class HotkeyFeedbackSystem:
         
         # Check if audio frequency is defined for this event
         if event_type not in self.audio_frequencies:
-            self.logger.warning(f"No audio frequency defined for event: {event_type}")
+            self.logger.warning("No audio frequency defined for event: %s", event_type)
             return
         
         # Get audio parameters
         frequency = self.audio_frequencies[event_type]
         duration = self.audio_durations[event_type]
         
-        # Play audio feedback in a separate thread to avoid blocking
-        audio_thread = threading.Thread(
-            target=self._play_audio,
-            args=(frequency, duration),
-            daemon=True
-        )
-        audio_thread.start()
+        # Hand the beep to the audio worker so the caller never blocks
+        if self._audio_thread is None:
+            self._start_audio_worker()
+        try:
+            self._audio_queue.put_nowait((_synthesize_tone(frequency, duration), frequency, duration))
+        except queue.Full:
+            self.logger.debug("Audio feedback queue full, dropping %s beep", event_type)
+    
+    def _start_audio_worker(self):
+        """Start the audio worker thread if it isn't running yet."""
+        with self._audio_lock:
+            if self._audio_thread is None:
+                self._audio_thread = threading.Thread(
+                    target=self._audio_loop, name="HotkeyAudioFeedback", daemon=True
+                )
+                self._audio_thread.start()
     
-    def _play_audio(self, frequency: int, duration: int):
+    def _audio_loop(self):
+        """Play queued beeps until the None sentinel arrives."""
+        get = self._audio_queue.get
+        play = self._play_audio
+        while True:
+            item = get()
+            if item is None:
+                break
+            play(*item)
+    
+    def _play_audio(self, wav: bytes, frequency: int, duration: int):
         """
         Play audio feedback using Windows API.
         
         Args:
+            wav: The beep rendered as an in-memory WAV file
             frequency: Frequency in Hz
             duration: Duration in milliseconds
         """
         try:
-            # Use Windows API to play a beep
-            winsound.Beep(frequency, duration)
+            # Play the pre-rendered beep from memory
+            winsound.PlaySound(wav, winsound.SND_MEMORY | winsound.SND_NODEFAULT)
         except Exception as e:
-            self.logger.error(f"Failed to play audio feedback: {e}")
+            self.logger.error("Failed to play audio feedback: %s", e)
             
             # Fallback: try to use the audio device callback if available
             if self.config.audio_device_callback:
                 try:
                     self.config.audio_device_callback(frequency, duration)
                 except Exception as callback_error:
-                    self.logger.error(f"Audio callback also failed: {callback_error}")
+                    self.logger.error("Audio callback also failed: %s", callback_error)
     
     def _update_visual_state(self, new_state: str):
         """
@@ -197,9 +241,9 @@ class HotkeyFeedbackSystem:
             try:
                 self.config.system_tray_callback(new_state, state_config)
             except Exception as e:
-                self.logger.error(f"Failed to update system tray: {e}")
+                self.logger.error("Failed to update system tray: %s", e)
         
-        self.logger.debug(f"Updated visual state to: {new_state}")
+        self.logger.debug("Updated visual state to: %s", new_state)
     
     def set_system_tray_callback(self, callback: Callable):
         """
@@ -261,7 +305,8 @@ class HotkeyFeedbackSystem:
         """
         self.audio_frequencies[event_type] = frequency
         self.audio_durations[event_type] = duration
-        self.logger.info(f"Added custom audio event: {event_type} ({frequency}Hz, {duration}ms)")
+        _synthesize_tone(frequency, duration)
+        self.logger.info("Added custom audio event: %s (%sHz, %sms)", event_type, frequency, duration)
     
     def add_custom_visual_state(self, state_name: str, icon: str, color: str):
         """
@@ -273,7 +318,7 @@ class HotkeyFeedbackSystem:
             color: Color identifier
         """
         self.visual_states[state_name] = {'icon': icon, 'color': color}
-        self.logger.info(f"Added custom visual state: {state_name}")
+        self.logger.info("Added custom visual state: %s", state_name)
     
     def test_audio_feedback(self, event_type: str = 'success'):
         """
@@ -282,7 +327,7 @@ class HotkeyFeedbackSystem:
         Args:
             event_type: Event type to test
         """
-        self.logger.info(f"Testing audio feedback for: {event_type}")
+        self.logger.info("Testing audio feedback for: %s", event_type)
         self._provide_audio_feedback(event_type)
     
     def test_visual_feedback(self, state: str = 'recording'):
@@ -292,13 +337,20 @@ class HotkeyFeedbackSystem:
         Args:
             state: State to test
         """
-        self.logger.info(f"Testing visual feedback for state: {state}")
+        self.logger.info("Testing visual feedback for state: %s", state)
         self._update_visual_state(state)
     
     def cleanup(self):
         """Clean up the feedback system."""
         # Reset to idle state
         self._update_visual_state('idle')
+        
+        # Stop the audio worker once it has played what is already queued
+        with self._audio_lock:
+            audio_thread, self._audio_thread = self._audio_thread, None
+        if audio_thread is not None:
+            self._audio_queue.put(None)
+            audio_thread.join(timeout=2.0)
         self.logger.info("Feedback system cleanup completed")
     
     def __enter__(self):
@@ -6,7 +6,9 @@ It uses the global-hotkeys library to register and manage hotkeys across all Win
 """
 
 import logging
+import re
 import threading
+from functools import lru_cache
 from typing import Dict, Callable, Optional, List
 from dataclasses import dataclass
 from enum import Enum
@@ -54,6 +56,39 @@ except Exception:  # pragma: no cover - triggered when dependency is missing
     global_hotkeys = _DummyGlobalHotkeys()  # type: ignore
 
 
+# Common key name variations and their global-hotkeys compatible names
+_KEY_ALIASES = {
+    'win': 'window',
+    'windows': 'window',
+    'ctrl': 'control',
+    'spacebar': 'space',
+}
+
+# Whole key names only, so e.g. "winkey" is left alone
+_KEY_ALIAS_PATTERN = re.compile(r'\b(' + '|'.join(map(re.escape, _KEY_ALIASES)) + r')\b')
+
+# Distinct raw key combinations whose normalized form is remembered
+NORMALIZE_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_key_combination(key_combination: str) -> str:
+    """
+    Normalize a key combination string to ensure consistent format.
+    
+    Args:
+        key_combination: Raw key combination string
+        
+    Returns:
+        str: Normalized key combination
+    """
+    # Convert to lowercase and remove extra spaces, then replace every
+    # variation in a single pass
+    return _KEY_ALIAS_PATTERN.sub(
+        lambda match: _KEY_ALIASES[match.group(0)], key_combination.lower().strip()
+    )
+
+
 class HotkeyMode(Enum):
     """Enumeration for different hotkey activation modes."""
     TOGGLE = "toggle"  # Press once to start, press again to stop
@@ -293,34 +328,8 @@ class HotkeyManager:
         else:
             self.logger.warning(f"Received hotkey event for unknown key_id: {key_id}")
     
-    def _normalize_key_combination(self, key_combination: str) -> str:
-        """
-        Normalize a key combination string to ensure consistent format.
-        
-        Args:
-            key_combination: Raw key combination string
-            
-        Returns:
-            str: Normalized key combination
-        """
-        # Convert to lowercase and remove extra spaces
-        normalized = key_combination.lower().strip()
-        
-        # Replace common variations with global-hotkeys compatible names
-        # Use word boundaries to avoid partial replacements
-        import re
-        
-        # Replace with word boundaries to avoid partial matches
-        normalized = re.sub(r'\bwin\b', 'window', normalized)
-        normalized = re.sub(r'\bwindows\b', 'window', normalized)
-        normalized = re.sub(r'\bctrl\b', 'control', normalized)
-        normalized = re.sub(r'\bcontrol\b', 'control', normalized)
-        normalized = re.sub(r'\balt\b', 'alt', normalized)
-        normalized = re.sub(r'\bshift\b', 'shift', normalized)
-        normalized = re.sub(r'\bspace\b', 'space', normalized)
-        normalized = re.sub(r'\bspacebar\b', 'space', normalized)
-        
-        return normalized
+    # Shared, cached normalization (see the module-level function)
+    _normalize_key_combination = staticmethod(_normalize_key_combination)
     
     def get_registered_hotkeys(self) -> List[str]:
         """
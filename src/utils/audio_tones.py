@@ -0,0 +1,49 @@
+"""
+Feedback tone synthesis for Voice Dictation Assistant.
+
+This module renders the short beeps used for audio feedback as in-memory
+WAV files, so they can be played with winsound.PlaySound(SND_MEMORY).
+"""
+
+import io
+import math
+import struct
+import wave
+
+
+# Maximum number of tones waiting for an audio worker (further ones are dropped)
+AUDIO_QUEUE_SIZE = 8
+
+# Synthesized feedback tones: 16-bit mono PCM with short fades to avoid clicks
+TONE_SAMPLE_RATE = 22050
+TONE_FADE_SECONDS = 0.005
+
+
+def synthesize_tone(frequency: int, duration: int, amplitude: float = 1.0) -> bytes:
+    """
+    Render a sine tone as an in-memory WAV file.
+    
+    Args:
+        frequency: Frequency in Hz
+        duration: Duration in milliseconds
+        amplitude: Peak level from 0.0 (silent) to 1.0 (full scale)
+    
+    Returns:
+        bytes: The complete WAV file
+    """
+    count = TONE_SAMPLE_RATE * duration // 1000
+    fade = max(1, int(TONE_SAMPLE_RATE * TONE_FADE_SECONDS))
+    peak = 32767 * max(0.0, min(amplitude, 1.0))
+    step = 2 * math.pi * frequency / TONE_SAMPLE_RATE
+    samples = [
+        int(peak * min(1.0, i / fade, (count - i) / fade) * math.sin(step * i))
+        for i in range(count)
+    ]
+    
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(TONE_SAMPLE_RATE)
+        wav.writeframes(struct.pack(f'<{count}h', *samples))
+    return buffer.getvalue()
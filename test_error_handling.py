@@ -77,7 +77,6 @@ def test_user_friendly_messages(error_notifier):
     print("\nTesting user-friendly error messages...")
     
     from src.core.error_handler import ErrorInfo
-    from datetime import datetime
     
     # Test different error scenarios
     test_scenarios = [
@@ -95,7 +94,7 @@ def test_user_friendly_messages(error_notifier):
     for error_message, category_name in test_scenarios:
         category = ErrorCategory(category_name)
         error_info = ErrorInfo(
-            timestamp=datetime.now(),
+            timestamp=time.time_ns(),
             error_type=Exception,
             error_message=error_message,
             severity=ErrorSeverity.MEDIUM,
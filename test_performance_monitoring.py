@@ -102,22 +102,41 @@ def test_analytics_export():
         return False
     
     # Test analytics data save
+    temp_dir = tempfile.mkdtemp()
     try:
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
-            temp_file = f.name
+        monitor.analytics_dir = temp_dir
+        monitor.record_metric("test_metric", 42.5, "ms")
+        monitor.start_workflow_tracking("test_workflow")
+        monitor.record_workflow_step(WorkflowStep.RECORDING, 0.05)
+        monitor.end_workflow_tracking(True)
         
-        monitor.save_analytics_data("test_analytics.json")
+        filepath = monitor.save_analytics_data("test_analytics.jsonl")
         print("  ✓ Analytics data save works")
         
-        # Clean up
-        if os.path.exists(temp_file):
-            os.unlink(temp_file)
-            
+        # The file is JSON Lines: a header, then one record per line
+        with open(filepath, 'r') as f:
+            records = [json.loads(line) for line in f]
+        
+        header = records[0]
+        assert header['usage_statistics']['total_workflows'] == 1
+        assert header['usage_statistics']['hotkey_presses'] == 1
+        assert 'export_timestamp' in header
+        
+        metrics = [r['metric'] for r in records[1:] if 'metric' in r]
+        workflows = [r['workflow'] for r in records[1:] if 'workflow' in r]
+        assert [m['name'] for m in metrics] == [m.name for m in monitor.metrics]
+        assert metrics[-1]['value'] == 42.5
+        assert [w['workflow_id'] for w in workflows] == ["test_workflow"]
+        assert workflows[0]['success'] is True
+        print("  ✓ Analytics data round-trips through JSON Lines")
+        
     except Exception as e:
         print(f"  ✗ Analytics data save failed: {e}")
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
     
     print("  ✓ Analytics export tests passed\n")
     return True
@@ -299,6 +318,184 @@ def test_data_retention():
     return True
 
 
+def test_monitoring_restart():
+    """Test that monitoring can be restarted after being stopped twice."""
+    print("Testing Monitoring Restart...")
+    
+    monitor = PerformanceMonitor(monitoring_interval=0.05)
+    samples = []
+    monitor.add_resource_callback(samples.append)
+    
+    monitor.start_monitoring()
+    time.sleep(0.3)
+    monitor.stop_monitoring()
+    monitor.stop_monitoring()
+    
+    samples.clear()
+    monitor.start_monitoring()
+    time.sleep(0.3)
+    try:
+        assert monitor._dispatcher_thread.is_alive()
+        assert samples, "resource callbacks stopped after restart"
+        print("  ✓ Resource dispatch resumes after restart")
+    finally:
+        monitor.shutdown()
+    
+    print("  ✓ Monitoring restart tests passed\n")
+    return True
+
+
+def test_metrics_visible_while_monitoring():
+    """Test that recorded metrics are stored immediately while monitoring runs."""
+    print("Testing Metric Read-After-Write...")
+    
+    monitor = PerformanceMonitor(monitoring_interval=10.0)
+    received = []
+    monitor.add_metric_callback(received.append)
+    
+    monitor.start_monitoring()
+    try:
+        monitor.record_metric("latency", 12.5, "ms")
+        assert [m.name for m in monitor.metrics] == ["latency"]
+        print("  ✓ Metric stored before the next monitor tick")
+    finally:
+        monitor.stop_monitoring()
+    
+    # Callbacks queued for the monitor thread still run once it stops
+    assert [m.name for m in received] == ["latency"]
+    print("  ✓ Metric callbacks delivered")
+    
+    monitor.shutdown()
+    print("  ✓ Metric read-after-write tests passed\n")
+    return True
+
+
+def test_checkpoint_retention():
+    """Test that checkpoint records stay bounded and old checkpoint files expire."""
+    print("Testing Checkpoint Retention...")
+    
+    monitor = PerformanceMonitor()
+    monitor.analytics_enabled = True
+    temp_dir = tempfile.mkdtemp()
+    monitor.analytics_dir = temp_dir
+    
+    try:
+        # Without the monitor thread nothing writes checkpoints, so nothing is queued
+        for _ in range(100):
+            monitor.record_metric("test_metric", 1.0, "ms")
+        assert monitor._checkpoint_queue.empty()
+        print("  ✓ Checkpoint queue stays empty without a monitor thread")
+        
+        expired = os.path.join(temp_dir, "session_20000101_000000.jsonl")
+        current = os.path.join(temp_dir, "session_20990101_000000.jsonl")
+        for path in (expired, current):
+            with open(path, 'w') as f:
+                f.write("{}\n")
+        old = time.time() - (monitor.data_retention_days + 1) * 86400
+        os.utime(expired, (old, old))
+        
+        monitor._cleanup_old_data()
+        assert not os.path.exists(expired)
+        assert os.path.exists(current)
+        print("  ✓ Expired checkpoint files are removed")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    print("  ✓ Checkpoint retention tests passed\n")
+    return True
+
+
+def test_resource_history_tiers():
+    """Test that long resource windows are answered from coarser history."""
+    print("Testing Resource History Tiers...")
+    
+    monitor = PerformanceMonitor()
+    
+    # Twenty minutes of one-second samples, fed through the dispatcher
+    now = time.monotonic()
+    for i in range(1200):
+        values = (time.time_ns(), float(i), 50.0, 1024.0, 40.0, 0, 0, 0, 0)
+        monitor._dispatch_queue.put((now - 1200 + i, values))
+    monitor._dispatch_queue.put(None)
+    monitor._dispatch_resources()
+    
+    # Full resolution keeps only the newest MAX_RESOURCE_SAMPLES
+    full = monitor.system_resources
+    assert len(full) == 1000
+    assert full[-1].cpu_percent == 1199.0
+    print("  ✓ Full-resolution history is bounded")
+    
+    recent = monitor.get_system_resources(minutes=5)
+    assert 295 <= len(recent) <= 300
+    assert all(b.cpu_percent - a.cpu_percent == 1 for a, b in zip(recent, recent[1:]))
+    print("  ✓ Short windows use full resolution")
+    
+    # Further back than the full-resolution history reaches
+    longer = monitor.get_system_resources(minutes=19)
+    assert 110 <= len(longer) <= 120
+    assert all(b.cpu_percent - a.cpu_percent == 10 for a, b in zip(longer, longer[1:]))
+    print("  ✓ Long windows use every tenth sample")
+    
+    print("  ✓ Resource history tier tests passed\n")
+    return True
+
+
+def test_checkpoint_file():
+    """Test that the monitor checkpoints new records to the session file."""
+    print("Testing Session Checkpoints...")
+    
+    monitor = PerformanceMonitor(monitoring_interval=10.0)
+    monitor.analytics_enabled = True
+    temp_dir = tempfile.mkdtemp()
+    monitor.analytics_dir = temp_dir
+    monitor._checkpoint_path = os.path.join(temp_dir, os.path.basename(monitor._checkpoint_path))
+    
+    try:
+        monitor.start_monitoring()
+        monitor.record_metric("test_metric", 1.5, "ms")
+        monitor.shutdown()
+        
+        with open(monitor._checkpoint_path, 'r') as f:
+            records = [json.loads(line) for line in f]
+        assert 'usage_statistics' in records[0]['checkpoint']
+        assert records[0]['checkpoint']['usage_statistics']['session_end'] is not None
+        assert [r['metric']['name'] for r in records[1:] if 'metric' in r] == ["test_metric"]
+        print("  ✓ Records are appended to the session checkpoint file")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    
+    print("  ✓ Session checkpoint tests passed\n")
+    return True
+
+
+def test_usage_counters_never_go_backwards():
+    """Test that an interleaved counter update can't publish a stale total."""
+    print("Testing Usage Counter Publishing...")
+    
+    monitor = PerformanceMonitor()
+    counters = monitor._usage_counters
+    
+    # Thread A draws 1, thread B draws 2 and publishes first, then A publishes
+    first = next(counters['hotkey_presses'])
+    second = next(counters['hotkey_presses'])
+    monitor._publish_usage(counters, 'hotkey_presses', second)
+    monitor._publish_usage(counters, 'hotkey_presses', first)
+    assert monitor.get_usage_statistics().hotkey_presses == 2
+    print("  ✓ Late publish of an older value is ignored")
+    
+    # A value drawn before clear_data doesn't leak into the new session
+    stale = next(counters['hotkey_presses'])
+    monitor.clear_data()
+    monitor._publish_usage(counters, 'hotkey_presses', stale)
+    assert monitor.get_usage_statistics().hotkey_presses == 0
+    monitor.record_hotkey_press()
+    assert monitor.get_usage_statistics().hotkey_presses == 1
+    print("  ✓ Counters restart after clear_data")
+    
+    print("  ✓ Usage counter tests passed\n")
+    return True
+
+
 def main():
     """Run all performance monitoring and analytics tests."""
     print("=" * 60)
@@ -311,7 +508,13 @@ def main():
         test_analytics_dashboard,
         test_configuration_integration,
         test_performance_reporter,
-        test_data_retention
+        test_data_retention,
+        test_monitoring_restart,
+        test_metrics_visible_while_monitoring,
+        test_checkpoint_retention,
+        test_resource_history_tiers,
+        test_checkpoint_file,
+        test_usage_counters_never_go_backwards
     ]
     
     passed = 0
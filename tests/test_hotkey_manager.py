@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock, call
 from hotkeys.hotkey_manager import HotkeyManager, HotkeyConfig, HotkeyMode
 from hotkeys.conflict_detector import HotkeyConflictDetector, ConflictLevel
 from hotkeys.push_to_talk import PushToTalkHandler, RecordingState, PushToTalkConfig
+from hotkeys.enhanced_hotkey_manager import EnhancedHotkeyManager
 
 
 class TestHotkeyManager:
@@ -241,6 +242,34 @@ class TestConflictDetector:
         conflict_info = detector.check_conflict("ctrl+s")
         assert conflict_info.level in [ConflictLevel.NONE, ConflictLevel.MEDIUM, ConflictLevel.HIGH]
 
+    @pytest.mark.unit
+    def test_conflicts_ignore_key_order(self):
+        """Test that shortcuts are detected however their keys are ordered."""
+        detector = HotkeyConflictDetector()
+        
+        # System shortcuts whose authored keys are not in sorted order
+        for hotkey in ("win+r", "r+win", "WIN+R", "win+period", "period+win"):
+            conflict_info = detector.check_conflict(hotkey)
+            assert conflict_info.level == ConflictLevel.HIGH, hotkey
+            assert conflict_info.conflict_type == "system_shortcut", hotkey
+        
+        # Spaces around the separators are ignored too
+        assert detector.check_conflict("Win + R").level == ConflictLevel.HIGH
+        
+        for hotkey in ("ctrl+v", "v+ctrl"):
+            conflict_info = detector.check_conflict(hotkey)
+            assert conflict_info.level == ConflictLevel.MEDIUM, hotkey
+            assert conflict_info.conflict_type == "application_shortcut", hotkey
+
+    @pytest.mark.unit
+    def test_repeated_conflict_checks_agree(self):
+        """Test that repeated checks return the same conflict information."""
+        detector = HotkeyConflictDetector()
+        
+        first = detector.check_conflict("win+d")
+        assert detector.check_conflict("win+d") == first
+        assert detector.validate_hotkey("win+d")[0] is False
+
     @pytest.mark.unit
     def test_suggest_alternative_hotkeys(self):
         """Test suggestion of alternative hotkeys."""
@@ -430,4 +459,87 @@ class TestPushToTalkHandler:
         assert handler.config.min_hold_time == 0.5
         assert handler.config.max_hold_time == 10.0
         assert handler.config.visual_feedback is False
-        assert handler.config.audio_feedback is False 
\ No newline at end of file
+        assert handler.config.audio_feedback is False 
+
+
+class TestEnhancedHotkeyManager:
+    """Test cases for EnhancedHotkeyManager class."""
+
+    @pytest.mark.unit
+    def test_is_recording_through_handler_lifecycle(self):
+        """Test is_recording() as a push-to-talk handler records and returns to idle."""
+        manager = EnhancedHotkeyManager({'min_hold_time': 0.0})
+        seen_while_starting = []
+        
+        success, _ = manager.register_push_to_talk_hotkey(
+            "ctrl+win+j", start_callback=lambda: seen_while_starting.append(manager.is_recording())
+        )
+        assert success is True
+        handler = manager.get_push_to_talk_handler("ctrl+win+j")
+        
+        # A caller's own state callbacks must not affect the answer
+        handler.register_state_callback(RecordingState.RECORDING, lambda: None)
+        handler.register_state_callback(RecordingState.PROCESSING, lambda: None)
+        
+        assert manager.is_recording() is False
+        
+        # Any spelling the conflict detector treats as the same finds the handler
+        assert manager.get_push_to_talk_handler("J + Win + CTRL") is handler
+        
+        handler.on_key_down()
+        time.sleep(0.1)
+        assert handler.state == RecordingState.RECORDING
+        assert manager.is_recording() is True
+        assert manager.is_recording("ctrl+win+j") is True
+        assert seen_while_starting == [True]
+        
+        handler.on_key_up()
+        assert handler.state == RecordingState.IDLE
+        assert manager.is_recording() is False
+        
+        manager.cleanup()
+
+
+class TestHotkeyFeedbackSystem:
+    """Test cases for HotkeyFeedbackSystem audio tones."""
+
+    @pytest.mark.unit
+    def test_tones_are_synthesized_wav(self):
+        """Test that feedback beeps are rendered as 16-bit mono WAV data."""
+        pytest.importorskip("winsound")
+        import io
+        import wave
+        from hotkeys.feedback_system import HotkeyFeedbackSystem, _synthesize_tone
+        from utils.audio_tones import TONE_SAMPLE_RATE
+        
+        feedback = HotkeyFeedbackSystem()
+        frequency = feedback.audio_frequencies['recording_start']
+        duration = feedback.audio_durations['recording_start']
+        
+        with wave.open(io.BytesIO(_synthesize_tone(frequency, duration))) as wav:
+            assert wav.getnchannels() == 1
+            assert wav.getsampwidth() == 2
+            assert wav.getframerate() == TONE_SAMPLE_RATE
+            assert wav.getnframes() == TONE_SAMPLE_RATE * duration // 1000
+        
+        feedback.cleanup()
+
+    @pytest.mark.unit
+    def test_custom_audio_event_renders_tone(self):
+        """Test that adding a custom audio event renders its tone up front."""
+        pytest.importorskip("winsound")
+        from hotkeys.feedback_system import HotkeyFeedbackSystem, _synthesize_tone
+        
+        feedback = HotkeyFeedbackSystem()
+        misses = _synthesize_tone.cache_info().misses
+        feedback.add_custom_audio_event('custom_event', 523, 120)
+        assert _synthesize_tone.cache_info().misses == misses + 1
+        
+        # Playing it is then a cache hit
+        hits = _synthesize_tone.cache_info().hits
+        feedback._provide_audio_feedback('custom_event')
+        assert _synthesize_tone.cache_info().hits == hits + 1
+        assert _synthesize_tone.cache_info().misses == misses + 1
+        
+        feedback.cleanup()
+